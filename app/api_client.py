@@ -14,7 +14,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from dotenv import load_dotenv
 
-from app.utils.search.entities import AliasDatabase, normalize_for_matching
+from app.utils.search.entities import (
+    AliasDatabase,
+    get_alias_database,
+    normalize_for_matching,
+    player_match_score,
+)
 from app.cache import get_cache_manager, CacheMeta
 from config.settings import settings
 
@@ -58,12 +63,19 @@ _last_cache_meta: Optional[CacheMeta] = None
 # Alias database for legacy API search helpers
 _alias_db: Optional[AliasDatabase] = None
 
+# Common first names that match too many players to resolve on their own
+_AMBIGUOUS_NAMES = frozenset({
+    "john", "james", "david", "michael", "chris", "christian",
+    "daniel", "alex", "alexander", "martin", "marcus", "max",
+    "ben", "jack", "joe", "sam", "matt", "luke", "ryan", "adam",
+})
+
 
 def _get_alias_db() -> AliasDatabase:
     """Get shared alias database for API client search helpers."""
     global _alias_db
     if _alias_db is None:
-        _alias_db = AliasDatabase()
+        _alias_db = get_alias_database()
     return _alias_db
 
 
@@ -74,49 +86,25 @@ def _normalize_text(text: str) -> str:
 
 def _is_ambiguous_query(query: str) -> bool:
     """Check if a query is potentially ambiguous (very short or common name)."""
-    normalized = _normalize_text(query)
-
-    if len(normalized) <= 3:
+    if not query or len(query.strip()) <= 3:
         return True
 
-    ambiguous_names = {
-        "john", "james", "david", "michael", "chris", "christian",
-        "daniel", "alex", "alexander", "martin", "marcus", "max",
-        "ben", "jack", "joe", "sam", "matt", "luke", "ryan", "adam"
-    }
-
-    return normalized in ambiguous_names
+    normalized = _normalize_text(query)
+    return len(normalized) <= 3 or normalized in _AMBIGUOUS_NAMES
 
 
 def _score_player_match(player: Dict[str, Any], query: str) -> float:
     """Score how well a player matches the query."""
-    normalized_query = _normalize_text(query)
-    player_name = _normalize_text(player.get("name", ""))
-
-    score = 0.0
-
-    if player_name == normalized_query:
-        score += 100
-    elif player_name.startswith(normalized_query):
-        score += 50
-    elif normalized_query in player_name:
-        score += 25
-
-    appearances = player.get("appearances", 0) or 0
-    score += min(appearances * 0.5, 20)
-
-    goals = player.get("goals", 0) or 0
-    assists = player.get("assists", 0) or 0
-    score += min((goals + assists) * 0.3, 15)
-
-    return score
+    return player_match_score(player, _normalize_text(query))
 
 
 def _rank_players(players: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
     """Rank players by relevance to query."""
-    scored = [(player, _score_player_match(player, query)) for player in players]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return [player for player, score in scored]
+    # Normalize the query once for the whole ranking pass
+    normalized_query = _normalize_text(query)
+    scores = [player_match_score(player, normalized_query) for player in players]
+    order = sorted(range(len(players)), key=scores.__getitem__, reverse=True)
+    return [players[i] for i in order]
 
 
 def _cache_key(endpoint: str, params: dict) -> str:
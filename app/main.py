@@ -9,6 +9,7 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime
+from heapq import nlargest
 from pathlib import Path
 
 from app import api_client
@@ -119,6 +120,12 @@ def cache_stats():
     return api_client.get_cache_stats()
 
 
+@app.get("/cache/stats/sportmonks")
+def sportmonks_cache_stats():
+    """Get Sportmonks response cache statistics (hit rate, entries)."""
+    return sportmonks_client.get_response_cache_stats()
+
+
 @app.get("/api/analytics")
 def search_analytics():
     """
@@ -185,8 +192,9 @@ def api_dashboard(
     date_str = target_date.strftime("%Y-%m-%d")
 
     try:
-        # Fetch matches from Sportmonks
-        sportmonks_matches = sportmonks_client.get_fixtures_by_date(date_str)
+        # Fetch matches from Sportmonks (summaries only - the dashboard never
+        # shows events, statistics or lineups)
+        sportmonks_matches = sportmonks_client.get_fixtures_by_date(date_str, light=True)
 
         # Transform Sportmonks data to match expected dashboard format
         def transform_match(m):
@@ -402,7 +410,7 @@ def api_search_suggest(
     Returns: {"suggestions": [{"name": "Luke Shaw", "type": "player", ...}]}
     """
     from app.utils.search.entities import (
-        AliasDatabase, fuzzy_match, get_fuzzy_threshold, normalize_for_matching,
+        get_alias_database, fuzzy_match, get_fuzzy_threshold, normalize_for_matching,
         tokenize_query, get_entity_tokens, multi_token_match_score, token_match_score
     )
 
@@ -410,8 +418,8 @@ def api_search_suggest(
     suggestions = []
     seen_ids = set()
 
-    # Load alias database
-    alias_db = AliasDatabase()
+    # Shared alias database (loaded once per process)
+    alias_db = get_alias_database()
     threshold = max(0.50, get_fuzzy_threshold(query) - 0.10)  # More lenient for autocomplete
 
     # Tokenize query for smarter matching
@@ -4185,11 +4193,10 @@ def match_center(request: Request, fixture_id: int):
                 limit=5
             )
 
-        # Check for xG data (premium feature)
-        xg_data = sportmonks_client.get_xg_data(fixture_id)
-
-        # Get trends data for momentum chart
-        trends_data = sportmonks_client.get_trends_data(fixture_id)
+        # xG (premium feature) and trends for the momentum chart, one request
+        advanced = sportmonks_client.get_advanced_fixture_bundle(fixture_id)
+        xg_data = advanced["xg"]
+        trends_data = advanced["trends"]
 
         # Check if we have official lineups, otherwise try predicted XI
         is_predicted_lineup = False
@@ -4274,11 +4281,10 @@ def match_live_update(fixture_id: int, include_ratings: bool = Query(False)):
         # Calculate momentum
         momentum = sportmonks_client.calculate_attacks_momentum(match.get("statistics", {}))
 
-        # Check for xG (premium)
-        xg_data = sportmonks_client.get_xg_data(fixture_id)
-
-        # Get trends data for momentum chart
-        trends_data = sportmonks_client.get_trends_data(fixture_id)
+        # xG (premium) and trends for the momentum chart, one request
+        advanced = sportmonks_client.get_advanced_fixture_bundle(fixture_id)
+        xg_data = advanced["xg"]
+        trends_data = advanced["trends"]
 
         # Check if official lineups are now available
         lineups = match.get("lineups", {})
@@ -4321,10 +4327,16 @@ def match_live_update(fixture_id: int, include_ratings: bool = Query(False)):
 
 
 @app.get("/api/sportmonks/livescores")
-def sportmonks_livescores():
+def sportmonks_livescores(
+    light: bool = Query(False, description="Summaries only (no events or statistics)"),
+    card_stats: bool = Query(False, description="Only the statistics shown on live match cards"),
+):
     """Get all current live matches from Sportmonks."""
     try:
-        matches = sportmonks_client.get_livescores()
+        matches = sportmonks_client.get_livescores(
+            statistic_types=sportmonks_client.LIVE_STATISTIC_TYPES if card_stats else None,
+            light=light,
+        )
         return {"matches": matches, "count": len(matches)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4766,19 +4778,22 @@ def team_hub(request: Request, team_id: int):
     Shows team overview, recent form, upcoming matches, squad, and stats.
     """
     try:
-        # Fetch team details
-        team = sportmonks_client.get_team_details(team_id)
+        # Fetch the independent sections concurrently. Recent matches are
+        # fetched once at 20 for season stats; the form uses the first 5.
+        hub = sportmonks_client.get_team_hub_data(team_id, recent_limit=20)
+
+        team = hub["team"]
         if not team:
             return HTMLResponse(
                 content="<h1>Team not found</h1><p><a href='/'>← Back to Dashboard</a></p>",
                 status_code=404
             )
 
-        # Get recent form (last 5 matches) - do this first to extract league info
-        recent_matches = sportmonks_client.get_team_recent_matches(team_id, limit=5) or []
+        all_recent = hub["recent_matches"] or []
+        recent_matches = all_recent[:5]
 
         # Try to get team's league info from API first
-        league_info = sportmonks_client.get_team_league_info(team_id)
+        league_info = hub["league_info"]
 
         # If API fails (404), extract league info from recent matches
         if not league_info and recent_matches:
@@ -4805,49 +4820,50 @@ def team_hub(request: Request, team_id: int):
         league_id = league_info.get("id") if league_info else None
         season_id = league_info.get("season_id") if league_info else None
 
-        # Get next match
-        next_match = sportmonks_client.get_team_next_match(team_id)
+        next_match = hub["next_match"]
+        opponent_id = next_match.get("opponent", {}).get("id") if next_match else None
+
+        # Opponent form and standings depend on the hub data; fetch both together
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            opponent_future = None
+            if opponent_id:
+                opponent_future = executor.submit(
+                    sportmonks_client.get_team_recent_matches, opponent_id, 5
+                )
+
+            standings_future = None
+            if season_id:
+                standings_future = executor.submit(sportmonks_client.get_standings, season_id=season_id)
+            elif league_id:
+                # Try live standings by league_id if no season_id
+                standings_future = executor.submit(sportmonks_client.get_standings, league_id=league_id)
 
         # Get opponent form if there's a next match
         opponent_form = []
-        if next_match:
-            opponent_id = next_match.get("opponent", {}).get("id")
-            if opponent_id:
-                opponent_recent = sportmonks_client.get_team_recent_matches(opponent_id, limit=5)
-                opponent_form = [m.get("result", "?") for m in opponent_recent]
+        if opponent_future:
+            opponent_form = [m.get("result", "?") for m in opponent_future.result()]
 
         # Get standings if we have league/season info
-        standings = []
+        standings = standings_future.result() if standings_future else []
         team_standing = None
-        if season_id:
-            standings = sportmonks_client.get_standings(season_id=season_id)
-            # Find this team's position in standings
-            for standing in standings:
-                if standing.get("team_id") == team_id:
-                    team_standing = standing
-                    break
-        elif league_id:
-            # Try live standings by league_id if no season_id
-            standings = sportmonks_client.get_standings(league_id=league_id)
-            for standing in standings:
-                if standing.get("team_id") == team_id:
-                    team_standing = standing
-                    break
+        # Find this team's position in standings
+        for standing in standings:
+            if standing.get("team_id") == team_id:
+                team_standing = standing
+                break
 
-        # Get squad and top performers
-        squad = sportmonks_client.get_team_squad(team_id)
-        top_scorers = sportmonks_client.get_team_top_scorers(team_id, limit=3)
+        # Squad and top performers
+        squad = hub["squad"]
+        top_scorers = hub["top_scorers"]
 
-        # Calculate current streak
-        streak = sportmonks_client.get_current_streak(team_id)
+        # Current streak
+        streak = hub["streak"]
 
         # Calculate team form string (W/D/L)
         team_form = [m.get("result", "?") for m in recent_matches]
 
         # Calculate season stats from recent matches (more reliable than failing API)
-        # Get more matches for accurate stats
-        all_recent = sportmonks_client.get_team_recent_matches(team_id, limit=20) or []
-
         season_stats = {
             "played": len(all_recent),
             "won": sum(1 for m in all_recent if m.get("result") == "W"),
@@ -4877,9 +4893,9 @@ def team_hub(request: Request, team_id: int):
                 "position": team_standing.get("position") or season_stats["position"],
             })
 
-        # Sort squad by different metrics for top performers
-        top_rated = sorted(squad, key=lambda p: p.get("stats", {}).get("rating", 0) or 0, reverse=True)[:3] if squad else []
-        top_assists = sorted(squad, key=lambda p: p.get("stats", {}).get("assists", 0) or 0, reverse=True)[:3] if squad else []
+        # Top performers by different metrics (top 3 only, no full sort)
+        top_rated = nlargest(3, squad, key=lambda p: p.get("stats", {}).get("rating", 0) or 0) if squad else []
+        top_assists = nlargest(3, squad, key=lambda p: p.get("stats", {}).get("assists", 0) or 0) if squad else []
 
         # Create standings slice (5 teams around current team position)
         standings_slice = []
@@ -4945,19 +4961,17 @@ def team_api(team_id: int):
     Returns comprehensive team info for AJAX updates.
     """
     try:
-        team = sportmonks_client.get_team_details(team_id)
+        # Fetch the independent sections concurrently
+        hub = sportmonks_client.get_team_hub_data(team_id)
+
+        team = hub["team"]
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
 
-        # Get league info
-        league_info = sportmonks_client.get_team_league_info(team_id)
+        league_info = hub["league_info"]
         season_id = league_info.get("season_id") if league_info else None
-
-        # Get recent form
-        recent_matches = sportmonks_client.get_team_recent_matches(team_id, limit=5)
-
-        # Get next match
-        next_match = sportmonks_client.get_team_next_match(team_id)
+        recent_matches = hub["recent_matches"]
+        next_match = hub["next_match"]
 
         # Get standings
         standings = []
@@ -4969,20 +4983,14 @@ def team_api(team_id: int):
                     team_standing = standing
                     break
 
-        # Get top scorers
-        top_scorers = sportmonks_client.get_team_top_scorers(team_id, limit=3)
-
-        # Calculate streak
-        streak = sportmonks_client.get_current_streak(team_id)
-
         return {
             "team": team,
             "league_info": league_info,
             "recent_matches": recent_matches,
             "next_match": next_match,
             "team_standing": team_standing,
-            "top_scorers": top_scorers,
-            "streak": streak,
+            "top_scorers": hub["top_scorers"],
+            "streak": hub["streak"],
         }
     except HTTPException:
         raise
@@ -4,18 +4,38 @@ Legacy search utilities (deprecated).
 Deprecated in favor of app.utils.search.entities and the unified search pipeline.
 """
 import warnings
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
-from app.utils.search.entities import AliasDatabase, normalize_for_matching
+from app.utils.search.entities import (
+    DEFAULT_ALIASES_PATH,
+    AliasDatabase,
+    get_alias_database,
+    normalize_for_matching,
+    player_match_score,
+)
 
 # Legacy file kept for compatibility, now pointing to unified aliases
 ALIASES_FILE = Path(__file__).parent.parent / "data" / "aliases.json"
 
+# Common ambiguous first names
+AMBIGUOUS_NAMES = frozenset({
+    "john", "james", "david", "michael", "chris", "christian",
+    "daniel", "alex", "alexander", "martin", "marcus", "max",
+    "ben", "jack", "joe", "sam", "matt", "luke", "ryan", "adam",
+})
+
 _alias_db: Optional[AliasDatabase] = None
+_warned = False
 
 
 def _warn_deprecated() -> None:
+    """Emit the deprecation warning once per process (warnings.warn is costly)."""
+    global _warned
+    if _warned:
+        return
+    _warned = True
     warnings.warn(
         "app.search_utils is deprecated. Use app.utils.search.entities instead.",
         DeprecationWarning,
@@ -24,13 +44,24 @@ def _warn_deprecated() -> None:
 
 
 def _get_alias_db() -> AliasDatabase:
-    """Load aliases from unified JSON file (cached)."""
+    """Load aliases from unified JSON file (shared with the search pipeline)."""
     global _alias_db
     if _alias_db is None:
-        _alias_db = AliasDatabase(str(ALIASES_FILE))
+        if ALIASES_FILE.resolve() == DEFAULT_ALIASES_PATH.resolve():
+            _alias_db = get_alias_database()
+        else:
+            _alias_db = AliasDatabase(str(ALIASES_FILE))
     return _alias_db
 
 
+def _first_match(matches: List[Any]) -> Tuple[Optional[str], Optional[int]]:
+    """Return (canonical_name, id) for the best match, or (None, None)."""
+    if not matches:
+        return None, None
+    match = matches[0]
+    return match.name, int(match.entity_id)
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for search matching (legacy wrapper)."""
     _warn_deprecated()
@@ -43,12 +74,7 @@ def resolve_team_alias(query: str) -> Tuple[Optional[str], Optional[int]]:
     Returns (canonical_name, team_id) or (None, None) if no match.
     """
     _warn_deprecated()
-    alias_db = _get_alias_db()
-    matches = alias_db.match_team(query)
-    if not matches:
-        return None, None
-    match = matches[0]
-    return match.name, int(match.entity_id)
+    return _first_match(_get_alias_db().match_team(query))
 
 
 def resolve_player_alias(query: str) -> Tuple[Optional[str], Optional[int]]:
@@ -57,54 +83,52 @@ def resolve_player_alias(query: str) -> Tuple[Optional[str], Optional[int]]:
     Returns (canonical_name, player_id) or (None, None) if no match.
     """
     _warn_deprecated()
-    alias_db = _get_alias_db()
-    matches = alias_db.match_player(query)
-    if not matches:
-        return None, None
-    match = matches[0]
-    return match.name, int(match.entity_id)
+    return _first_match(_get_alias_db().match_player(query))
 
 
-def resolve_alias(query: str) -> Dict[str, Any]:
+@lru_cache(maxsize=1024)
+def _resolve_normalized(normalized: str) -> Tuple[str, Optional[str], Optional[int]]:
     """
-    Resolve a query against both team and player aliases.
-    Returns dict with resolution info.
+    Resolve a normalized query to (type, canonical_name, id), memoized.
+
+    The alias database is read-only once loaded, so results are stable and
+    repeat queries (including the common no-match case) skip fuzzy matching.
     """
-    _warn_deprecated()
-    normalized = normalize_text(query)
+    if not normalized:
+        return "unknown", None, None
+
+    alias_db = _get_alias_db()
 
     # Check team aliases
-    team_canonical, team_id = resolve_team_alias(query)
+    team_canonical, team_id = _first_match(alias_db.match_team(normalized))
     if team_canonical:
-        return {
-            "type": "team",
-            "original_query": query,
-            "normalized_query": normalized,
-            "canonical": team_canonical,
-            "id": team_id,
-            "matched": True
-        }
+        return "team", team_canonical, team_id
 
     # Check player aliases
-    player_canonical, player_id = resolve_player_alias(query)
+    player_canonical, player_id = _first_match(alias_db.match_player(normalized))
     if player_canonical:
-        return {
-            "type": "player",
-            "original_query": query,
-            "normalized_query": normalized,
-            "canonical": player_canonical,
-            "id": player_id,
-            "matched": True
-        }
-
-    # No alias match - return normalized query
+        return "player", player_canonical, player_id
+
+    return "unknown", None, None
+
+
+def resolve_alias(query: str) -> Dict[str, Any]:
+    """
+    Resolve a query against both team and player aliases.
+    Returns dict with resolution info.
+    """
+    _warn_deprecated()
+    normalized = normalize_for_matching(query or "")
+    entity_type, canonical, entity_id = _resolve_normalized(normalized)
+
+    # No alias match leaves canonical/id as None with type "unknown"
     return {
-        "type": "unknown",
+        "type": entity_type,
         "original_query": query,
         "normalized_query": normalized,
-        "canonical": None,
-        "id": None,
-        "matched": False
+        "canonical": canonical,
+        "id": entity_id,
+        "matched": canonical is not None,
     }
 
 
@@ -113,11 +137,12 @@ def get_search_queries(query: str) -> List[str]:
     Get list of queries to try for search.
     Returns [canonical_name] if alias matched, otherwise [original_query].
     """
-    resolution = resolve_alias(query)
+    # Skip building the full resolution dict - only the canonical name matters
+    _, canonical, _ = _resolve_normalized(normalize_for_matching(query or ""))
 
-    if resolution["matched"] and resolution["canonical"]:
+    if canonical:
         # Return both canonical and original to maximize matches
-        return [resolution["canonical"], query]
+        return [canonical, query]
 
     return [query]
 
@@ -126,23 +151,13 @@ def is_ambiguous_query(query: str) -> bool:
     """
     Check if a query is potentially ambiguous (very short or common name).
     """
-    normalized = normalize_text(query)
-
-    # Very short queries are often ambiguous
-    if len(normalized) <= 3:
+    # Very short queries are often ambiguous (normalizing only shortens text,
+    # so the raw length answers this without running the regexes)
+    if not query or len(query.strip()) <= 3:
         return True
 
-    # Common ambiguous first names
-    ambiguous_names = {
-        "john", "james", "david", "michael", "chris", "christian",
-        "daniel", "alex", "alexander", "martin", "marcus", "max",
-        "ben", "jack", "joe", "sam", "matt", "luke", "ryan", "adam"
-    }
-
-    if normalized in ambiguous_names:
-        return True
-
-    return False
+    normalized = normalize_text(query)
+    return len(normalized) <= 3 or normalized in AMBIGUOUS_NAMES
 
 
 def score_player_match(player: Dict[str, Any], query: str) -> float:
@@ -150,39 +165,17 @@ def score_player_match(player: Dict[str, Any], query: str) -> float:
     Score how well a player matches the query.
     Higher score = better match.
     """
-    normalized_query = normalize_text(query)
-    player_name = normalize_text(player.get("name", ""))
-
-    score = 0.0
-
-    # Exact match
-    if player_name == normalized_query:
-        score += 100
-
-    # Name starts with query
-    elif player_name.startswith(normalized_query):
-        score += 50
-
-    # Query is in name
-    elif normalized_query in player_name:
-        score += 25
-
-    # Bonus for more appearances (more notable player)
-    appearances = player.get("appearances", 0) or 0
-    score += min(appearances * 0.5, 20)  # Cap at 20 bonus points
-
-    # Bonus for goals/assists (more notable)
-    goals = player.get("goals", 0) or 0
-    assists = player.get("assists", 0) or 0
-    score += min((goals + assists) * 0.3, 15)  # Cap at 15 bonus points
-
-    return score
+    _warn_deprecated()
+    return player_match_score(player, normalize_for_matching(query or ""))
 
 
 def rank_players(players: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
     """
     Rank players by relevance to query.
     """
-    scored = [(player, score_player_match(player, query)) for player in players]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return [player for player, score in scored]
+    _warn_deprecated()
+    # Normalize the query once for the whole ranking pass
+    normalized_query = normalize_for_matching(query or "")
+    scores = [player_match_score(player, normalized_query) for player in players]
+    order = sorted(range(len(players)), key=scores.__getitem__, reverse=True)
+    return [players[i] for i in order]
@@ -3,11 +3,43 @@ Sportmonks API Client for Football View
 Handles all Sportmonks v3 API interactions
 """
 import os
+import json
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import threading
+import time
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit
 import requests
-from functools import lru_cache
+import urllib3
+from functools import lru_cache, partial
+from heapq import nlargest, nsmallest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ciso8601
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+try:
+    import brotli  # noqa: F401 - enables br decoding in urllib3
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
 
 from config.settings import settings
 
@@ -43,6 +75,12 @@ STAT_TYPES = {
     "RATING": 118,
 }
 
+# Reverse lookup: type_id -> lowercase stat key
+STAT_NAME_BY_TYPE_ID = {type_id: name.lower() for name, type_id in STAT_TYPES.items()}
+
+# (lowercase stat key, type_id) pairs for building empty statistics rows
+STAT_ROW_KEYS = tuple((name.lower(), type_id) for name, type_id in STAT_TYPES.items())
+
 # Event type IDs
 EVENT_TYPES = {
     14: "goal",
@@ -82,6 +120,19 @@ MATCH_STATES = {
     22: {"short": "BT", "long": "Break Time", "is_live": True, "is_finished": False},
 }
 
+# state_id -> (state info, is_finished, is_live), built once so per-fixture
+# checks are a single lookup. Unknown ids fall back to "Not Started".
+_STATE_TABLE: Dict[int, Tuple[Dict[str, Any], bool, bool]] = {
+    sid: (info, info.get("is_finished", False), info.get("is_live", False))
+    for sid, info in MATCH_STATES.items()
+}
+
+
+def _state(state_id: Any) -> Tuple[Dict[str, Any], bool, bool]:
+    """Return (state info, is_finished, is_live) for a Sportmonks state id."""
+    return _STATE_TABLE.get(state_id) or _STATE_TABLE[1]
+
+
 # Sportmonks League IDs - All 25 Leagues in Plan
 SUPPORTED_LEAGUES = {
     # European Competitions
@@ -130,30 +181,349 @@ SUPPORTED_LEAGUES = {
     501: "Premiership",             # Scotland
 }
 
+# Fixed include sets, built once instead of per request
+H2H_INCLUDES = ("participants", "scores")
+TEAM_FIXTURES_INCLUDES = ("participants", "scores", "league", "venue", "state")
+TEAM_INCLUDES = ("venue", "country")
+TEAM_STATS_INCLUDES = ("venue", "country", "statistics.details")
+TEAM_DETAILS_INCLUDES = ("venue", "country", "coaches", "statistics.details")
+TEAM_LEAGUES_INCLUDES = ("currentSeason",)
+STANDINGS_INCLUDES = ("participant", "details")
+SQUAD_INCLUDES = ("player",)
+TRENDS_INCLUDES = ("trends", "participants")
+XG_INCLUDES = ("xGFixture", "participants")
+ADVANCED_INCLUDES = ("trends", "xGFixture", "participants")
+LEAGUE_FIXTURES_INCLUDES = ("participants", "scores", "state", "round", "league")
+
+
+# Shared HTTP session so keep-alive connections (and TLS sessions) are reused
+# across calls instead of opening a new connection per request. The pool is
+# sized for the concurrent fetches (page fan-out, Team Hub) running across
+# request threads; a smaller pool discards sockets once it overflows.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        ),
+    ),
+)
+# Brotli compresses JSON tighter than gzip, but urllib3 can only decode it
+# when a brotli package is installed - only advertise it in that case.
+HTTP_HEADERS = {
+    "Accept-Encoding": "br, gzip" if HAS_BROTLI else "gzip",
+    "Connection": "keep-alive",
+    "User-Agent": "football-view/1.0",
+}
+_session.headers.update(HTTP_HEADERS)
+
+# Bare urllib3 pool for the hot polling paths (livescores, single fixtures):
+# same keep-alive and retries as _session without requests' per-call
+# overhead (prepared requests, hooks, cookie jar).
+_pool = urllib3.connection_from_url(
+    SPORTMONKS_BASE_URL,
+    maxsize=20,
+    block=False,
+    retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    ),
+    headers=HTTP_HEADERS,
+)
+_POOL_PATH = urlsplit(SPORTMONKS_BASE_URL).path
+
+
+# In-process response cache: {key: (expires_at, response)}
+# TTLs are picked by endpoint prefix (first match wins); 0 disables caching.
+RESPONSE_CACHE_MAX_ENTRIES = 2048
+RESPONSE_CACHE_DEFAULT_TTL = 60
+RESPONSE_CACHE_TTLS: List[Tuple[str, int]] = [
+    ("livescores", 5),                  # Live data - just enough to absorb bursts
+    ("fixtures/date/", 30),
+    ("fixtures/between/", 60),
+    ("fixtures/head-to-head/", 3600),
+    ("teams/search/", 3600),
+    ("teams/", 3600),                   # Includes teams/{id}/current-leagues
+    ("standings/live/", 15),            # Moves with in-progress matches
+    ("standings/seasons/", 600),        # Changes at most once per matchday
+    ("squads/", 300),
+]
+FINISHED_FIXTURE_TTL = 3600
+ACTIVE_FIXTURE_TTL = 15
+LIVE_FIXTURE_TTL = 3                    # Live match detail polling
+
+_response_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+_response_cache_lock = threading.Lock()
+
+# Cache keys currently being fetched; waiters block on the event
+_inflight_requests: Dict[Tuple, threading.Event] = {}
+INFLIGHT_WAIT_TIMEOUT = 30  # Matches the HTTP timeout
+
+# Hit/miss counters for get_response_cache_stats (guarded by the cache lock)
+_response_cache_counts = {"hits": 0, "misses": 0, "coalesced": 0}
+
+# Processed fixture lists, valid while their source response is still cached
+_processed_cache: Dict[Tuple, Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]] = {}
+
+# Expired responses (and processed fixtures of responses no longer cached)
+# are swept on insert at most this often, or whenever the cache is full
+RESPONSE_CACHE_SWEEP_INTERVAL = 30
+_response_cache_next_sweep = 0.0
+
+
+def _sweep_response_cache(now: float) -> None:
+    """Drop expired responses and orphaned processed fixtures (call with the cache lock held)."""
+    global _response_cache_next_sweep
+    _response_cache_next_sweep = now + RESPONSE_CACHE_SWEEP_INTERVAL
+
+    for key in [key for key, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[key]
+
+    live = {id(response) for _, response in _response_cache.values()}
+    for key in [key for key, (data, _) in _processed_cache.items() if id(data) not in live]:
+        del _processed_cache[key]
+
+
+def _response_cache_ttl(endpoint: str, response: Dict[str, Any]) -> int:
+    """Pick the cache TTL for a successful response."""
+    if endpoint.startswith("fixtures/") and endpoint[9:].isdigit():
+        # Single fixture: finished matches are stable, live/upcoming are not
+        fixture = response.get("data") or {}
+        _, is_finished, is_live = _state(fixture.get("state_id"))
+        if is_finished:
+            return FINISHED_FIXTURE_TTL
+        return LIVE_FIXTURE_TTL if is_live else ACTIVE_FIXTURE_TTL
+
+    for prefix, ttl in RESPONSE_CACHE_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return RESPONSE_CACHE_DEFAULT_TTL
+
+
+def _response_cache_prefix(endpoint: str) -> str:
+    """The RESPONSE_CACHE_TTLS prefix an endpoint is cached under."""
+    if endpoint.startswith("fixtures/") and endpoint[9:].isdigit():
+        return "fixtures/{id}"
+    for prefix, _ in RESPONSE_CACHE_TTLS:
+        if endpoint.startswith(prefix):
+            return prefix
+    return "other"
+
+
+def clear_response_cache() -> int:
+    """Clear cached Sportmonks responses. Returns number of entries cleared."""
+    with _response_cache_lock:
+        count = len(_response_cache)
+        _response_cache.clear()
+        _processed_cache.clear()
+    return count
+
+
+def get_response_cache_stats() -> Dict[str, Any]:
+    """
+    Get response cache statistics (entries, hits, misses, hit rate).
+
+    entries_by_prefix counts cached entries per RESPONSE_CACHE_TTLS prefix
+    (single fixtures under "fixtures/{id}") to help tune the TTLs.
+    """
+    with _response_cache_lock:
+        stats = dict(_response_cache_counts)
+        stats["entries"] = len(_response_cache)
+        stats["in_flight"] = len(_inflight_requests)
+        endpoints = [key[0] for key in _response_cache]
+
+    by_prefix: Dict[str, int] = {}
+    for endpoint in endpoints:
+        prefix = _response_cache_prefix(endpoint)
+        by_prefix[prefix] = by_prefix.get(prefix, 0) + 1
+    stats["entries_by_prefix"] = by_prefix
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
 
 def _make_request(
     endpoint: str,
     params: Optional[Dict[str, Any]] = None,
-    include: Optional[List[str]] = None,
+    include: Optional[Sequence[str]] = None,
+    no_cache: bool = False,
+    filters: Optional[Dict[str, Sequence[Any]]] = None,
+    fast: bool = False,
 ) -> Dict[str, Any]:
-    """Make a request to the Sportmonks API."""
-    url = f"{SPORTMONKS_BASE_URL}/{endpoint}"
+    """
+    Make a request to the Sportmonks API.
 
-    request_params = {"api_token": SPORTMONKS_API_KEY}
-    if params:
-        request_params.update(params)
-    if include:
-        request_params["include"] = ";".join(include)
+    Successful responses are cached in-process with a per-endpoint TTL, and
+    concurrent callers missing on the same key share one upstream request.
+    Cached responses are shared, so callers must not mutate them.
+    Pass no_cache=True to bypass the cache.
+
+    filters are applied server-side, e.g. {"fixtureStatisticTypes": [45, 42]}
+    becomes filters=fixtureStatisticTypes:45,42.
+    fast=True sends the request through the bare urllib3 pool (hot paths).
+    """
+    fetch = _fetch_fast if fast else _fetch
+    if filters:
+        params = {**(params or {}), "filters": _serialize_filters(filters, (params or {}).get("filters"))}
+    cache_key = (endpoint, tuple(sorted((params or {}).items())), tuple(include or ()))
+    if no_cache:
+        return fetch(endpoint, params, include)
+
+    with _response_cache_lock:
+        cached = _response_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            _response_cache_counts["hits"] += 1
+            return cached[1]
+        _response_cache_counts["misses"] += 1
+        # Coalesce concurrent misses: the first caller fetches, others wait
+        inflight = _inflight_requests.get(cache_key)
+        if inflight is None:
+            _inflight_requests[cache_key] = threading.Event()
+        else:
+            _response_cache_counts["coalesced"] += 1
+
+    if inflight is not None:
+        inflight.wait(timeout=INFLIGHT_WAIT_TIMEOUT)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        # Leader failed or the response was not cacheable - fetch directly
+        return fetch(endpoint, params, include)
 
     try:
-        response = requests.get(url, params=request_params, timeout=30)
+        data = fetch(endpoint, params, include)
+
+        if "error" not in data:
+            ttl = _response_cache_ttl(endpoint, data)
+            if ttl > 0:
+                with _response_cache_lock:
+                    now = time.monotonic()
+                    if (now >= _response_cache_next_sweep
+                            or len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES):
+                        _sweep_response_cache(now)
+                    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                        # Still full of live entries - evict the oldest insertion
+                        _response_cache.pop(next(iter(_response_cache)))
+                    _response_cache[cache_key] = (now + ttl, data)
+    finally:
+        with _response_cache_lock:
+            _inflight_requests.pop(cache_key).set()
+
+    return data
+
+
+def _serialize_filters(filters: Dict[str, Sequence[Any]], existing: Optional[str] = None) -> str:
+    """Serialize filters as Sportmonks expects: key:a,b;key2:c."""
+    parts = [existing] if existing else []
+    parts.extend(f"{key}:{','.join(map(str, values))}" for key, values in filters.items())
+    return ";".join(parts)
+
+
+def _process_fixtures_cached(
+    key: Tuple,
+    data: Dict[str, Any],
+    fixtures: List[Dict[str, Any]],
+    light: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Run _process_fixture over fixtures taken from response `data`, memoized.
+
+    Processed fixtures are reused for as long as _make_request keeps serving
+    the same cached response object, so callers sharing a window (e.g. team
+    fixtures and recent matches) parse each fixture at most once, and only
+    the fixtures they actually return. Results are shared; do not mutate them.
+    """
+    key = key + (light,)
+    with _response_cache_lock:
+        entry = _processed_cache.get(key)
+        if entry is None or entry[0] is not data:
+            entry = (data, {})
+            if "error" not in data:
+                if len(_processed_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    _sweep_response_cache(time.monotonic())
+                if len(_processed_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    _processed_cache.pop(next(iter(_processed_cache)))
+                _processed_cache[key] = entry
+    memo = entry[1]
+
+    processed = []
+    for fixture in fixtures:
+        # Raw fixtures live as long as `data`, so their ids are stable keys
+        result = memo.get(id(fixture))
+        if result is None:
+            result = memo[id(fixture)] = _process_fixture(fixture, light=light)
+        processed.append(result)
+    return processed
+
+
+def _fetch(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    include: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Perform the HTTP request against the Sportmonks API (uncached)."""
+    url = f"{SPORTMONKS_BASE_URL}/{endpoint}"
+
+    try:
+        response = _session.get(url, params=_request_params(params, include), timeout=30)
         response.raise_for_status()
+        if HAS_ORJSON:
+            # Large fixture pages parse several times faster than stdlib json
+            return orjson.loads(response.content)
         return response.json()
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
+        # ValueError covers malformed bodies (orjson.JSONDecodeError)
+        logger.error(f"Sportmonks API error: {e}")
+        return {"data": None, "error": str(e)}
+
+
+def _fetch_fast(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    include: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Like _fetch, but through the bare urllib3 pool."""
+    try:
+        response = _pool.request(
+            "GET",
+            f"{_POOL_PATH}/{endpoint}",
+            fields=_request_params(params, include),
+            timeout=30,
+        )
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"{response.status} Error for {endpoint}")
+        if HAS_ORJSON:
+            return orjson.loads(response.data)
+        return json.loads(response.data)
+    except (urllib3.exceptions.HTTPError, ValueError) as e:
         logger.error(f"Sportmonks API error: {e}")
         return {"data": None, "error": str(e)}
 
 
+def _request_params(
+    params: Optional[Dict[str, Any]],
+    include: Optional[Sequence[str]],
+) -> Dict[str, Any]:
+    """Query parameters for a Sportmonks request (token, params, include)."""
+    request_params = {"api_token": SPORTMONKS_API_KEY}
+    if params:
+        request_params.update(params)
+    if include:
+        request_params["include"] = ";".join(include)
+    return request_params
+
+
 # =============================================================================
 # FIXTURE / MATCH ENDPOINTS
 # =============================================================================
@@ -180,7 +550,7 @@ def get_fixture_by_id(
     if include_scores:
         includes.append("scores")
 
-    data = _make_request(f"fixtures/{fixture_id}", include=includes)
+    data = _make_request(f"fixtures/{fixture_id}", include=includes, fast=True)
 
     if not data.get("data"):
         return None
@@ -188,25 +558,57 @@ def get_fixture_by_id(
     return _process_fixture(data["data"])
 
 
-def get_livescores(include_events: bool = True, include_statistics: bool = True) -> List[Dict[str, Any]]:
-    """Get all current live matches."""
+# Statistics shown on live match cards - pass as statistic_types to
+# get_livescores() to have the rest filtered out upstream
+LIVE_STATISTIC_TYPES = (
+    STAT_TYPES["SHOTS_TOTAL"],
+    STAT_TYPES["SHOTS_ON_TARGET"],
+    STAT_TYPES["POSSESSION"],
+    STAT_TYPES["ATTACKS"],
+    STAT_TYPES["DANGEROUS_ATTACKS"],
+)
+
+
+def get_livescores(
+    include_events: bool = True,
+    include_statistics: bool = True,
+    statistic_types: Optional[Sequence[int]] = None,
+    light: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get all current live matches.
+
+    statistic_types optionally limits the statistics Sportmonks sends back
+    (statistics is by far the largest array per fixture, e.g. pass
+    LIVE_STATISTIC_TYPES for card views); by default every type is returned.
+    light=True returns summaries only (teams, score, state, kickoff): events
+    and statistics are neither requested nor processed.
+    """
     includes = ["participants", "league", "state", "scores"]
-    if include_events:
+    filters = None
+    if include_events and not light:
         includes.append("events")
-    if include_statistics:
+    if include_statistics and not light:
         includes.append("statistics")
+        if statistic_types:
+            filters = {"fixtureStatisticTypes": statistic_types}
 
-    data = _make_request("livescores", include=includes)
+    data = _make_request("livescores", include=includes, filters=filters, fast=True)
 
     if not data.get("data"):
         return []
 
-    return [_process_fixture(f) for f in data["data"]]
+    return [_process_fixture(f, light=light) for f in data["data"]]
+
+
+# Pages requested per concurrent wave when the total page count is unknown
+PAGE_PREFETCH = 3
 
 
 def get_fixtures_by_date(
     date: str,
     league_ids: Optional[List[int]] = None,
+    light: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Get fixtures for a specific date.
@@ -214,36 +616,89 @@ def get_fixtures_by_date(
     Args:
         date: Date in YYYY-MM-DD format
         league_ids: Optional list of league IDs to filter
+        light: Summaries only (see _process_fixture), for list views
+    """
+    return list(iter_fixtures_by_date(date, league_ids, light))
+
+
+def iter_fixtures_by_date(
+    date: str,
+    league_ids: Optional[List[int]] = None,
+    light: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield processed fixtures for a date, page by page.
+
+    Later pages are already in flight while earlier ones are processed, and
+    callers that stream the results never hold the full processed list.
+
+    Args:
+        date: Date in YYYY-MM-DD format
+        league_ids: Optional list of league IDs to filter
+        light: Summaries only (see _process_fixture), for list views
     """
     includes = ["participants", "league", "state", "scores", "venue"]
+    process = partial(_process_fixture, light=light)
 
     params = {"per_page": 100}  # Request more items per page
     if league_ids:
         params["filters"] = f"fixtureLeagues:{','.join(map(str, league_ids))}"
 
-    all_fixtures = []
-    page = 1
+    endpoint = f"fixtures/date/{date}"
     max_pages = 10  # Safety limit
 
-    while page <= max_pages:
-        params["page"] = page
-        data = _make_request(f"fixtures/date/{date}", params=params, include=includes)
-
-        if not data.get("data"):
-            break
-
-        all_fixtures.extend(data["data"])
-
-        # Check pagination for more pages
-        pagination = data.get("pagination", {})
-        if not pagination.get("has_more", False):
-            break
+    def fetch_page(p: int) -> Dict[str, Any]:
+        return _make_request(endpoint, params={**params, "page": p}, include=includes)
 
-        page += 1
+    data = fetch_page(1)
+    if not data.get("data"):
+        return
 
-    logger.info(f"Fetched {len(all_fixtures)} fixtures for {date} across {page} page(s)")
+    fetched = len(data["data"])
+    pagination = data.get("pagination", {})
+    page = 1
 
-    return [_process_fixture(f) for f in all_fixtures]
+    if not pagination.get("has_more", False):
+        yield from map(process, data["data"])
+    else:
+        last_page = min(pagination.get("last_page") or 0, max_pages)
+        if last_page > 1:
+            # Total is known up front - fetch the remaining pages concurrently
+            with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as executor:
+                pages = executor.map(fetch_page, range(2, last_page + 1))
+                yield from map(process, data["data"])
+                for page_data in pages:
+                    page_fixtures = page_data.get("data") or []
+                    fetched += len(page_fixtures)
+                    yield from map(process, page_fixtures)
+            page = last_page
+        else:
+            # Total unknown (only has_more) - fetch pages in small concurrent
+            # waves and stop at the first page that ends the listing. At most
+            # PAGE_PREFETCH - 1 requests past the end are wasted.
+            with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as executor:
+                wave = executor.map(fetch_page, range(2, min(1 + PAGE_PREFETCH, max_pages) + 1))
+                yield from map(process, data["data"])
+                done = False
+                while not done:
+                    for page_data in wave:
+                        if not page_data.get("data"):
+                            done = True
+                            break
+                        page += 1
+                        fetched += len(page_data["data"])
+                        yield from map(process, page_data["data"])
+                        if not page_data.get("pagination", {}).get("has_more", False):
+                            done = True
+                            break
+                    if not done:
+                        if page >= max_pages:
+                            break
+                        wave = executor.map(
+                            fetch_page, range(page + 1, min(page + PAGE_PREFETCH, max_pages) + 1)
+                        )
+
+    logger.info(f"Fetched {fetched} fixtures for {date} across {page} page(s)")
 
 
 def get_head_to_head(team1_id: int, team2_id: int, limit: int = 5) -> Dict[str, Any]:
@@ -251,7 +706,7 @@ def get_head_to_head(team1_id: int, team2_id: int, limit: int = 5) -> Dict[str,
     data = _make_request(
         f"fixtures/head-to-head/{team1_id}/{team2_id}",
         params={"per_page": limit},
-        include=["participants", "scores"]
+        include=H2H_INCLUDES
     )
 
     if not data.get("data"):
@@ -263,7 +718,8 @@ def get_head_to_head(team1_id: int, team2_id: int, limit: int = 5) -> Dict[str,
     draws = 0
 
     for fixture in data["data"]:
-        processed = _process_fixture(fixture)
+        # H2H rows only show teams and scores, so skip events/stats/lineups
+        processed = _process_fixture(fixture, light=True)
         matches.append(processed)
 
         # Calculate winner
@@ -298,11 +754,13 @@ def get_head_to_head(team1_id: int, team2_id: int, limit: int = 5) -> Dict[str,
 # =============================================================================
 
 def get_team_by_id(team_id: int, include_statistics: bool = False) -> Optional[Dict[str, Any]]:
-    """Get team details by ID."""
-    includes = ["venue", "country"]
-    if include_statistics:
-        includes.append("statistics.details")
+    """
+    Get team details by ID.
 
+    Team metadata is near-static; repeat lookups are served by the response
+    cache (teams/ TTL) without a round-trip.
+    """
+    includes = TEAM_STATS_INCLUDES if include_statistics else TEAM_INCLUDES
     data = _make_request(f"teams/{team_id}", include=includes)
 
     if not data.get("data"):
@@ -320,59 +778,67 @@ def get_team_by_id(team_id: int, include_statistics: bool = False) -> Optional[D
     }
 
 
+# (expires_at monotonic, datetime) - replaced as a whole, so readers never
+# see a torn pair; concurrent refreshes just compute now() twice
+_now_cache: Tuple[float, Optional[datetime]] = (0.0, None)
+
+
+def _now_cached(ttl: float = 1.0) -> datetime:
+    """Return datetime.now(), reused for up to `ttl` seconds across calls."""
+    global _now_cache
+    expires_at, value = _now_cache
+    mono = time.monotonic()
+    if value is None or mono >= expires_at:
+        value = datetime.now()
+        _now_cache = (mono + ttl, value)
+    return value
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API (C parser when installed)."""
+    if HAS_CISO8601:
+        return ciso8601.parse_datetime(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=128)
+def _date_str(day: date, offset_days: int = 0) -> str:
+    """Format day + offset_days as YYYY-MM-DD (memoized, days repeat all day)."""
+    return (day + timedelta(days=offset_days)).isoformat()
+
+
 def get_team_form(team_id: int, limit: int = 5) -> List[str]:
     """
     Get team's recent form (W/D/L).
 
     Returns list like ["W", "W", "D", "L", "W"]
     """
-    from datetime import datetime, timedelta
-
-    # Use fixtures/between endpoint with date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=90)  # Look back 90 days
-
-    data = _make_request(
-        f"fixtures/between/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}/{team_id}",
-        include=["participants", "scores", "state"]
-    )
-
-    if not data.get("data"):
+    # Look back 90 days in the shared past team window (one request per team
+    # for form, past fixtures and recent matches)
+    window = _team_fixtures_window(team_id)
+    if window is None:
         return []
+    fixtures = window[2]
 
-    # Sort by date descending to get most recent first
-    fixtures = sorted(
-        data["data"],
-        key=lambda x: x.get("starting_at", ""),
-        reverse=True
-    )
+    # Only count finished matches; take the most recent `limit` of them
+    # (partial sort, same order as a full descending sort)
+    finished = [f for f in fixtures if _state(f.get("state_id", 0))[1]]
+    fixtures = nlargest(limit, finished, key=lambda x: x.get("starting_at", ""))
 
     form = []
     for fixture in fixtures:
-        state_id = fixture.get("state_id", 0)
-        state = MATCH_STATES.get(state_id, {})
-
-        # Only count finished matches
-        if not state.get("is_finished"):
-            continue
-
-        # Find team's score from participants
-        participants = fixture.get("participants", [])
-        scores = fixture.get("scores", [])
-
-        team_goals = 0
-        opponent_goals = 0
-
-        for participant in participants:
-            p_id = participant.get("id")
-            # Find score for this participant
-            for score in scores:
-                if score.get("participant_id") == p_id and score.get("description") == "CURRENT":
-                    goals = score.get("score", {}).get("goals", 0) or 0
-                    if p_id == team_id:
-                        team_goals = goals
-                    else:
-                        opponent_goals = goals
+        # Index CURRENT goals by participant, then look up both sides
+        current_goals = {
+            score.get("participant_id"): score.get("score", {}).get("goals", 0) or 0
+            for score in fixture.get("scores", [])
+            if score.get("description") == "CURRENT"
+        }
+        opponent_id = next(
+            (p.get("id") for p in fixture.get("participants", []) if p.get("id") != team_id),
+            None,
+        )
+        team_goals = current_goals.get(team_id, 0)
+        opponent_goals = current_goals.get(opponent_id, 0)
 
         if team_goals > opponent_goals:
             form.append("W")
@@ -381,121 +847,135 @@ def get_team_form(team_id: int, limit: int = 5) -> List[str]:
         else:
             form.append("D")
 
-        if len(form) >= limit:
-            break
-
-    return form[:limit]
+    return form
 
 
 # =============================================================================
 # DATA PROCESSING HELPERS
 # =============================================================================
 
-def _process_fixture(fixture: Dict[str, Any]) -> Dict[str, Any]:
-    """Process raw Sportmonks fixture into UI-friendly format."""
+def _process_fixture(fixture: Dict[str, Any], light: bool = False) -> Dict[str, Any]:
+    """
+    Process raw Sportmonks fixture into UI-friendly format.
+
+    With light=True, events, statistics, lineups and formations are left
+    empty (list views such as team fixtures don't display them).
+    """
+    get = fixture.get
+
     # Basic info
-    fixture_id = fixture.get("id")
-    name = fixture.get("name", "")
-    starting_at = fixture.get("starting_at")
+    fixture_id = get("id")
+    name = get("name", "")
+    starting_at = get("starting_at")
 
     # State
-    state_id = fixture.get("state_id", 1)
-    state_info = MATCH_STATES.get(state_id, MATCH_STATES[1])
+    state_id = get("state_id", 1)
+    state_info, is_finished, is_live = _state(state_id)
 
     # Participants (teams)
-    participants = fixture.get("participants", [])
+    participants = get("participants", [])
     home_team = None
     away_team = None
 
     for p in participants:
+        pget = p.get
         team_data = {
-            "id": p.get("id"),
-            "name": p.get("name"),
-            "short_code": p.get("short_code") or _get_short_code(p.get("name", "")),
-            "logo": p.get("image_path"),
+            "id": pget("id"),
+            "name": pget("name"),
+            "short_code": pget("short_code") or _get_short_code(pget("name", "")),
+            "logo": pget("image_path"),
         }
-        if p.get("meta", {}).get("location") == "home":
+        if _location(p) == "home":
             home_team = team_data
         else:
             away_team = team_data
 
-    # Scores - None for upcoming matches, actual values for live/finished
-    scores = fixture.get("scores", [])
-    home_score = None
-    away_score = None
-    halftime_home = None
-    halftime_away = None
-
-    for score in scores:
-        participant_id = score.get("participant_id")
-        score_data = score.get("score", {})
-        goals = score_data.get("goals", 0) or 0
-        description = score.get("description", "")
-
-        if description == "CURRENT":
-            if home_team and participant_id == home_team["id"]:
-                home_score = goals
-            elif away_team and participant_id == away_team["id"]:
-                away_score = goals
-        elif description == "1ST_HALF":
-            if home_team and participant_id == home_team["id"]:
-                halftime_home = goals
-            elif away_team and participant_id == away_team["id"]:
-                halftime_away = goals
+    # participant_id -> "home"/"away" (home wins if both ids collide)
+    sides = _team_sides(home_team, away_team)
+
+    # Scores - None for upcoming matches, actual values for live/finished.
+    # (participant_id, description) -> (description, side), so each score
+    # row is one lookup; other periods and participants miss and are skipped.
+    score_targets = {
+        (participant_id, description): (description, side)
+        for participant_id, side in sides.items()
+        for description in SCORE_DESCRIPTIONS
+    }
+    score_slots = {}
+    for score in get("scores", []):
+        slot = score_targets.get((score.get("participant_id"), score.get("description", "")))
+        if slot:
+            score_slots[slot] = score.get("score", {}).get("goals", 0) or 0
+
+    home_score = score_slots.get(("CURRENT", "home"))
+    away_score = score_slots.get(("CURRENT", "away"))
+    halftime_home = score_slots.get(("1ST_HALF", "home"))
+    halftime_away = score_slots.get(("1ST_HALF", "away"))
 
     # For finished/live matches, ensure scores are set (default to 0 if no CURRENT score found)
-    if state_info.get("is_finished") or state_info.get("is_live"):
+    if is_finished or is_live:
         if home_score is None:
             home_score = 0
         if away_score is None:
             away_score = 0
 
-    # Events
-    events = []
-    for event in fixture.get("events", []):
-        events.append(_process_event(event, home_team, away_team))
-
-    # Sort events by minute (most recent first)
-    events.sort(key=lambda e: (e.get("minute", 0), e.get("sort_order", 0)), reverse=True)
-
-    # Statistics
-    statistics = _process_statistics(fixture.get("statistics", []), home_team, away_team)
-
-    # Lineups
-    lineups = _process_lineups(fixture.get("lineups", []), home_team, away_team)
-
-    # Formations
-    formations = {}
-    for formation in fixture.get("formations", []):
-        participant_id = formation.get("participant_id")
-        formation_str = formation.get("formation")
-        if home_team and participant_id == home_team["id"]:
-            formations["home"] = formation_str
-        elif away_team and participant_id == away_team["id"]:
-            formations["away"] = formation_str
+    if light:
+        # List views never show these, so skip the per-fixture work
+        events = []
+        max_minute = -1
+        statistics = {}
+        lineups = {"home": [], "away": []}
+        formations = {}
+    else:
+        # Events (track the latest minute while building the list)
+        events = []
+        max_minute = -1
+        for event in get("events", []):
+            processed_event = _process_event(event, home_team, away_team, sides)
+            if processed_event["minute"] > max_minute:
+                max_minute = processed_event["minute"]
+            events.append(processed_event)
+
+        # Sort events by minute (most recent first)
+        events.sort(key=_EVENT_SORT_KEY, reverse=True)
+
+        # Statistics
+        statistics = _process_statistics(get("statistics", []), sides)
+
+        # Lineups
+        lineups = _process_lineups(get("lineups", []), sides)
+
+        # Formations
+        formations = {}
+        for formation in get("formations", []):
+            side = sides.get(formation.get("participant_id"))
+            if side:
+                formations[side] = formation.get("formation")
 
     # League info
-    league = fixture.get("league", {})
+    lget = get("league", {}).get
     league_info = {
-        "id": league.get("id"),
-        "name": league.get("name"),
-        "logo": league.get("image_path"),
+        "id": lget("id"),
+        "name": lget("name"),
+        "logo": lget("image_path"),
     }
 
     # Venue info
-    venue = fixture.get("venue", {})
-    venue_info = {
-        "id": venue.get("id"),
-        "name": venue.get("name"),
-        "city": venue.get("city_name"),
-        "capacity": venue.get("capacity"),
-        "surface": venue.get("surface"),
-    } if venue else None
+    venue = get("venue", {})
+    if venue:
+        vget = venue.get
+        venue_info = {
+            "id": vget("id"),
+            "name": vget("name"),
+            "city": vget("city_name"),
+            "capacity": vget("capacity"),
+            "surface": vget("surface"),
+        }
+    else:
+        venue_info = None
 
     # Calculate elapsed time from events if live
-    elapsed = None
-    if state_info["is_live"] and events:
-        elapsed = max(e.get("minute", 0) for e in events)
+    elapsed = max_minute if is_live and events else None
 
     return {
         "id": fixture_id,
@@ -518,64 +998,83 @@ def _process_fixture(fixture: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _process_event(event: Dict[str, Any], home_team: Optional[Dict], away_team: Optional[Dict]) -> Dict[str, Any]:
+def _location(participant: Dict[str, Any]) -> Optional[str]:
+    """Participant's meta.location ("home"/"away"), or None if missing."""
+    meta = participant.get("meta")
+    return meta.get("location") if meta else None
+
+
+def _team_sides(home_team: Optional[Dict], away_team: Optional[Dict]) -> Dict[Any, str]:
+    """Map participant IDs to "home"/"away" for O(1) side lookups."""
+    sides = {}
+    if away_team:
+        sides[away_team["id"]] = "away"
+    if home_team:
+        sides[home_team["id"]] = "home"
+    return sides
+
+
+# Score periods _process_fixture reads (full-time/current and half-time)
+SCORE_DESCRIPTIONS = frozenset({"CURRENT", "1ST_HALF"})
+
+
+# Processed events always carry both keys (missing values default to 0)
+_EVENT_SORT_KEY = itemgetter("minute", "sort_order")
+
+
+def _process_event(
+    event: Dict[str, Any],
+    home_team: Optional[Dict],
+    away_team: Optional[Dict],
+    sides: Dict[Any, str],
+) -> Dict[str, Any]:
     """Process a single event."""
-    type_id = event.get("type_id", 0)
+    # Bind the getter once; this runs for every event of every fixture
+    get = event.get
+    type_id = get("type_id", 0)
     event_type = EVENT_TYPES.get(type_id, "unknown")
 
     # Determine which team
-    participant_id = event.get("participant_id")
-    is_home = home_team and participant_id == home_team["id"]
+    is_home = sides.get(get("participant_id")) == "home"
     team = home_team if is_home else away_team
 
     return {
-        "id": event.get("id"),
-        "minute": event.get("minute", 0),
-        "extra_minute": event.get("extra_minute"),
+        "id": get("id"),
+        "minute": get("minute") or 0,
+        "extra_minute": get("extra_minute"),
         "type": event_type,
         "type_id": type_id,
-        "player_name": event.get("player_name"),
-        "player_id": event.get("player_id"),
-        "related_player_name": event.get("related_player_name"),  # Assist or sub out
-        "related_player_id": event.get("related_player_id"),
-        "info": event.get("info"),  # "Header", "Right foot", "Foul", etc.
-        "result": event.get("result"),  # Score after event like "1-0"
+        "player_name": get("player_name"),
+        "player_id": get("player_id"),
+        "related_player_name": get("related_player_name"),  # Assist or sub out
+        "related_player_id": get("related_player_id"),
+        "info": get("info"),  # "Header", "Right foot", "Foul", etc.
+        "result": get("result"),  # Score after event like "1-0"
         "team": team,
         "is_home": is_home,
-        "sort_order": event.get("sort_order", 0),
+        "sort_order": get("sort_order") or 0,
     }
 
 
 def _process_statistics(
     statistics: List[Dict[str, Any]],
-    home_team: Optional[Dict],
-    away_team: Optional[Dict]
+    sides: Dict[Any, str],
 ) -> Dict[str, Dict[str, Any]]:
     """Process statistics into home/away comparison format."""
-    result = {}
-
     # Initialize all stat types
-    for stat_name, type_id in STAT_TYPES.items():
-        result[stat_name.lower()] = {"home": 0, "away": 0, "type_id": type_id}
+    result = {key: {"home": 0, "away": 0, "type_id": type_id} for key, type_id in STAT_ROW_KEYS}
 
     for stat in statistics:
         type_id = stat.get("type_id")
         participant_id = stat.get("participant_id")
         value = stat.get("data", {}).get("value", 0)
 
-        # Find stat name
-        stat_name = None
-        for name, tid in STAT_TYPES.items():
-            if tid == type_id:
-                stat_name = name.lower()
-                break
-
+        stat_name = STAT_NAME_BY_TYPE_ID.get(type_id)
         if not stat_name:
             continue
 
-        # Assign to home or away
-        is_home = home_team and participant_id == home_team["id"]
-        if is_home:
+        # Assign to home or away (unknown participants count as away)
+        if sides.get(participant_id) == "home":
             result[stat_name]["home"] = value
         else:
             result[stat_name]["away"] = value
@@ -585,49 +1084,52 @@ def _process_statistics(
 
 def _process_lineups(
     lineups: List[Dict[str, Any]],
-    home_team: Optional[Dict],
-    away_team: Optional[Dict]
+    sides: Dict[Any, str],
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Process lineups into home/away format."""
     result = {"home": [], "away": []}
+    home_players = result["home"]
+    away_players = result["away"]
 
     # Rating type ID in Sportmonks
-    RATING_TYPE_ID = 118
+    rating_type_id = STAT_TYPES["RATING"]
 
     for player in lineups:
-        participant_id = player.get("team_id") or player.get("participant_id")
-        is_home = home_team and participant_id == home_team["id"]
+        get = player.get
+        participant_id = get("team_id") or get("participant_id")
 
         # Extract rating from details if available
         rating = None
-        details = player.get("details", [])
-        for detail in details:
-            if detail.get("type_id") == RATING_TYPE_ID:
+        for detail in get("details", []):
+            if detail.get("type_id") == rating_type_id:
                 rating = detail.get("data", {}).get("value")
                 break
 
+        position = get("position")
+        type_id = get("type_id")
         player_data = {
-            "id": player.get("player_id"),
-            "name": player.get("player_name"),
-            "number": player.get("jersey_number"),
-            "position": player.get("position", {}).get("name") if isinstance(player.get("position"), dict) else player.get("position_id"),
-            "position_id": player.get("position_id"),
-            "formation_position": player.get("formation_position"),
-            "type": player.get("type_id"),  # 11 = starting, 12 = sub
-            "is_starter": player.get("type_id") == 11,
+            "id": get("player_id"),
+            "name": get("player_name"),
+            "number": get("jersey_number"),
+            "position": position.get("name") if isinstance(position, dict) else get("position_id"),
+            "position_id": get("position_id"),
+            "formation_position": get("formation_position"),
+            "type": type_id,  # 11 = starting, 12 = sub
+            "is_starter": type_id == 11,
             "rating": rating,
         }
 
-        if is_home:
-            result["home"].append(player_data)
+        if sides.get(participant_id) == "home":
+            home_players.append(player_data)
         else:
-            result["away"].append(player_data)
+            away_players.append(player_data)
 
     return result
 
 
+@lru_cache(maxsize=4096)
 def _get_short_code(team_name: str) -> str:
-    """Generate a short code from team name."""
+    """Generate a short code from team name (memoized, names repeat constantly)."""
     if not team_name:
         return "???"
 
@@ -645,18 +1147,54 @@ def _get_short_code(team_name: str) -> str:
 # MOMENTUM / XG HELPERS (Placeholder for premium features)
 # =============================================================================
 
+# Momentum add-on is not purchased; callers can check this and skip the call
+MOMENTUM_ADDON_ENABLED = False
+
+# xG Type ID mapping
+XG_TYPES = {
+    5304: "xg",
+    5305: "xgot",
+    7943: "npxg",
+    9686: "xgp",
+    9687: "xga",
+    7942: "xgc",
+    7944: "xgsp",
+    7945: "xgop",
+}
+
+# (location, type_id) -> result key, and the zeroed result those keys fill
+XG_FIELDS = {
+    (location, type_id): f"{location}_{name}"
+    for type_id, name in XG_TYPES.items()
+    for location in ("home", "away")
+}
+XG_EMPTY_RESULT = {
+    f"{location}_{name}": 0.0
+    for name in ("xg", "xgot", "npxg", "xgp", "xga", "xgc", "xgsp", "xgop")
+    for location in ("home", "away")
+}
+
+
 def get_momentum_data(fixture_id: int) -> Optional[Dict[str, Any]]:
     """
     Get momentum data for a fixture.
 
     NOTE: Requires Momentum add-on ($20/mo).
     Returns None if not available, UI should fall back to attacks comparison.
+    Callers check MOMENTUM_ADDON_ENABLED before calling.
     """
-    # TODO: Implement when Momentum add-on is purchased
-    # For now, return None to trigger fallback
+    # Not implemented until the Momentum add-on is purchased
     return None
 
 
+# Trend type IDs (45=possession, 43=attacks, 44=dangerous_attacks) by side
+TREND_FIELDS = {
+    (location, type_id): f"{location}_{name}"
+    for location in ("home", "away")
+    for type_id, name in ((45, "possession"), (43, "attacks"), (44, "dangerous"))
+}
+
+
 def get_trends_data(fixture_id: int) -> Optional[Dict[str, Any]]:
     """
     Get minute-by-minute trends data for momentum chart visualization.
@@ -664,12 +1202,16 @@ def get_trends_data(fixture_id: int) -> Optional[Dict[str, Any]]:
     Returns possession, attacks, dangerous attacks, and shots per minute
     for building a momentum wave chart.
     """
-    data = _make_request(f"fixtures/{fixture_id}", include=["trends", "participants"])
+    data = _make_request(f"fixtures/{fixture_id}", include=TRENDS_INCLUDES)
 
     if not data.get("data"):
         return None
 
-    fixture = data["data"]
+    return _extract_trends(data["data"])
+
+
+def _extract_trends(fixture: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the get_trends_data payload from a fixture fetched with trends."""
     trends = fixture.get("trends", []) or []
 
     if not trends:
@@ -680,10 +1222,10 @@ def get_trends_data(fixture_id: int) -> Optional[Dict[str, Any]]:
     home_team_id = None
     away_team_id = None
     for p in participants:
-        meta = p.get("meta", {})
-        if meta.get("location") == "home":
+        location = _location(p)
+        if location == "home":
             home_team_id = p.get("id")
-        elif meta.get("location") == "away":
+        elif location == "away":
             away_team_id = p.get("id")
 
     # Group trends by minute
@@ -699,8 +1241,9 @@ def get_trends_data(fixture_id: int) -> Optional[Dict[str, Any]]:
         if minute is None:
             continue
 
-        if minute not in minutes_data:
-            minutes_data[minute] = {
+        row = minutes_data.get(minute)
+        if row is None:
+            row = minutes_data[minute] = {
                 "minute": minute,
                 "home_possession": 50,
                 "away_possession": 50,
@@ -710,30 +1253,23 @@ def get_trends_data(fixture_id: int) -> Optional[Dict[str, Any]]:
                 "away_dangerous": 0,
             }
 
-        # Type IDs: 45=possession, 43=attacks, 44=dangerous_attacks
         location = "home" if participant_id == home_team_id else "away"
 
-        if type_id == 45:  # Possession
-            minutes_data[minute][f"{location}_possession"] = value
-        elif type_id == 43:  # Attacks
-            minutes_data[minute][f"{location}_attacks"] = value
-        elif type_id == 44:  # Dangerous attacks
-            minutes_data[minute][f"{location}_dangerous"] = value
+        field = TREND_FIELDS.get((location, type_id))
+        if field:
+            row[field] = value
 
-    # Sort by minute and return as list
-    sorted_minutes = sorted(minutes_data.values(), key=lambda x: x["minute"])
+    # Sort by minute (the dict keys) and return as list
+    sorted_minutes = [minutes_data[minute] for minute in sorted(minutes_data)]
 
     # Calculate momentum score per minute (weighted: possession + attacks*2 + dangerous*3)
     for m in sorted_minutes:
         home_score = m["home_possession"] + (m["home_attacks"] * 2) + (m["home_dangerous"] * 3)
         away_score = m["away_possession"] + (m["away_attacks"] * 2) + (m["away_dangerous"] * 3)
         total = home_score + away_score
-        if total > 0:
-            m["home_momentum"] = round((home_score / total) * 100)
-            m["away_momentum"] = 100 - m["home_momentum"]
-        else:
-            m["home_momentum"] = 50
-            m["away_momentum"] = 50
+        home_momentum = round((home_score / total) * 100) if total > 0 else 50
+        m["home_momentum"] = home_momentum
+        m["away_momentum"] = 100 - home_momentum
 
     return {
         "minutes": sorted_minutes,
@@ -756,24 +1292,16 @@ def get_xg_data(fixture_id: int) -> Optional[Dict[str, Any]]:
         7944: xGSP (xG set piece)
         7945: xGOP (xG open play)
     """
-    # xG Type ID mapping
-    XG_TYPES = {
-        5304: "xg",
-        5305: "xgot",
-        7943: "npxg",
-        9686: "xgp",
-        9687: "xga",
-        7942: "xgc",
-        7944: "xgsp",
-        7945: "xgop",
-    }
-
-    data = _make_request(f"fixtures/{fixture_id}", include=["xGFixture", "participants"])
+    data = _make_request(f"fixtures/{fixture_id}", include=XG_INCLUDES)
 
     if not data.get("data"):
         return None
 
-    fixture = data["data"]
+    return _extract_xg(data["data"])
+
+
+def _extract_xg(fixture: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the get_xg_data payload from a fixture fetched with xGFixture."""
     # API returns lowercase 'xgfixture' not 'xGFixture'
     xg_fixture = fixture.get("xgfixture", []) or fixture.get("xGFixture", []) or []
 
@@ -781,16 +1309,7 @@ def get_xg_data(fixture_id: int) -> Optional[Dict[str, Any]]:
         return None
 
     # Initialize result
-    result = {
-        "home_xg": 0.0, "away_xg": 0.0,
-        "home_xgot": 0.0, "away_xgot": 0.0,
-        "home_npxg": 0.0, "away_npxg": 0.0,
-        "home_xgp": 0.0, "away_xgp": 0.0,
-        "home_xga": 0.0, "away_xga": 0.0,
-        "home_xgc": 0.0, "away_xgc": 0.0,
-        "home_xgsp": 0.0, "away_xgsp": 0.0,
-        "home_xgop": 0.0, "away_xgop": 0.0,
-    }
+    result = dict(XG_EMPTY_RESULT)
 
     # Parse xG data - API uses 'location' field (home/away) and 'data.value'
     for xg_item in xg_fixture:
@@ -804,31 +1323,79 @@ def get_xg_data(fixture_id: int) -> Optional[Dict[str, Any]]:
         else:
             xg_val = float(data_obj) if data_obj else 0.0
 
-        # Map type ID to key name
-        key_name = XG_TYPES.get(type_id)
-        if not key_name or not location:
-            continue
+        # Map (location, type ID) to the result key
+        field = XG_FIELDS.get((location, type_id))
+        if field is None:
+            key_name = XG_TYPES.get(type_id)
+            if not key_name or not location:
+                continue
+            # Unexpected location value - keep it as the key prefix
+            field = f"{location}_{key_name}"
 
-        # Use location directly (home/away)
         # Only use positive values (some metrics like xGP can be negative)
         if xg_val >= 0:
-            result[f"{location}_{key_name}"] = round(xg_val, 2)
+            result[field] = round(xg_val, 2)
 
     return result
 
 
+# After the combined xG + trends request fails (e.g. an include that is not on
+# the plan), use the separate requests for this long before trying it again
+ADVANCED_INCLUDE_RETRY_SECONDS = 3600
+_advanced_include_failed_until = 0.0
+
+
+def get_advanced_fixture_bundle(fixture_id: int) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Get xG, trends and momentum data for a fixture in one request.
+
+    Returns {"xg": ..., "trends": ..., "momentum": ...} with the same values
+    get_xg_data, get_trends_data and get_momentum_data would return. If the
+    combined request fails (e.g. one include is not on the plan), falls back
+    to the separate calls, and keeps using them for
+    ADVANCED_INCLUDE_RETRY_SECONDS.
+    """
+    global _advanced_include_failed_until
+
+    momentum = get_momentum_data(fixture_id) if MOMENTUM_ADDON_ENABLED else None
+
+    data = None
+    if time.monotonic() >= _advanced_include_failed_until:
+        data = _make_request(f"fixtures/{fixture_id}", include=ADVANCED_INCLUDES)
+        if "error" in data:
+            _advanced_include_failed_until = time.monotonic() + ADVANCED_INCLUDE_RETRY_SECONDS
+            data = None
+
+    if data is None:
+        return {
+            "xg": get_xg_data(fixture_id),
+            "trends": get_trends_data(fixture_id),
+            "momentum": momentum,
+        }
+
+    fixture = data.get("data")
+    return {
+        "xg": _extract_xg(fixture) if fixture else None,
+        "trends": _extract_trends(fixture) if fixture else None,
+        "momentum": momentum,
+    }
+
+
 def calculate_attacks_momentum(statistics: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate momentum from attacks data as fallback for premium momentum.
 
     Uses dangerous attacks weighted more heavily than regular attacks.
     """
-    attacks = statistics.get("attacks", {"home": 0, "away": 0})
-    dangerous = statistics.get("dangerous_attacks", {"home": 0, "away": 0})
+    # Bind counts to locals once; missing stats count as zero
+    attacks = statistics.get("attacks")
+    dangerous = statistics.get("dangerous_attacks")
+    home_attacks, away_attacks = (attacks["home"], attacks["away"]) if attacks else (0, 0)
+    home_dangerous, away_dangerous = (dangerous["home"], dangerous["away"]) if dangerous else (0, 0)
 
     # Weight: dangerous attacks count 2x
-    home_weighted = attacks["home"] + (dangerous["home"] * 2)
-    away_weighted = attacks["away"] + (dangerous["away"] * 2)
+    home_weighted = home_attacks + (home_dangerous * 2)
+    away_weighted = away_attacks + (away_dangerous * 2)
 
     total = home_weighted + away_weighted
     if total == 0:
@@ -837,20 +1404,17 @@ def calculate_attacks_momentum(statistics: Dict[str, Dict[str, Any]]) -> Dict[st
     home_percent = round((home_weighted / total) * 100)
     away_percent = 100 - home_percent
 
-    dominant = None
-    if home_percent > 55:
-        dominant = "home"
-    elif away_percent > 55:
-        dominant = "away"
+    # At most one side can be above 55%
+    dominant = "home" if home_percent > 55 else ("away" if away_percent > 55 else None)
 
     return {
         "home_percent": home_percent,
         "away_percent": away_percent,
         "dominant": dominant,
-        "home_attacks": attacks["home"],
-        "away_attacks": attacks["away"],
-        "home_dangerous": dangerous["home"],
-        "away_dangerous": dangerous["away"],
+        "home_attacks": home_attacks,
+        "away_attacks": away_attacks,
+        "home_dangerous": home_dangerous,
+        "away_dangerous": away_dangerous,
     }
 
 
@@ -863,8 +1427,7 @@ def get_team_details(team_id: int) -> Optional[Dict[str, Any]]:
     Get comprehensive team details for Team Hub.
     Includes venue, country, coach, and statistics.
     """
-    includes = ["venue", "country", "coaches", "statistics.details"]
-    data = _make_request(f"teams/{team_id}", include=includes)
+    data = _make_request(f"teams/{team_id}", include=TEAM_DETAILS_INCLUDES)
 
     if not data.get("data"):
         return None
@@ -874,16 +1437,12 @@ def get_team_details(team_id: int) -> Optional[Dict[str, Any]]:
     country = team.get("country", {}) or {}
 
     # Get current coach
-    coaches = team.get("coaches", [])
-    current_coach = None
-    for coach in coaches:
-        if coach.get("active"):
-            current_coach = {
-                "id": coach.get("coach_id"),
-                "name": coach.get("common_name") or coach.get("fullname"),
-                "image": coach.get("image_path"),
-            }
-            break
+    coach = next((c for c in team.get("coaches", []) if c.get("active")), None)
+    current_coach = {
+        "id": coach.get("coach_id"),
+        "name": coach.get("common_name") or coach.get("fullname"),
+        "image": coach.get("image_path"),
+    } if coach else None
 
     # Process statistics
     statistics = _process_team_statistics(team.get("statistics", []))
@@ -909,18 +1468,31 @@ def get_team_details(team_id: int) -> Optional[Dict[str, Any]]:
     }
 
 
+# Shared read-only stand-in for missing nested objects (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Team season statistic type IDs with home/away/total counts
+TEAM_COUNT_STATS = {
+    52: "goals_scored",
+    88: "goals_conceded",
+    194: "clean_sheets",
+    214: "wins",
+    215: "draws",
+    216: "losses",
+}
+
+# Team season statistic type IDs whose raw value is kept as-is
+TEAM_RAW_STATS = {
+    196: "scoring_minutes",
+    213: "conceding_minutes",
+}
+
+
 def _process_team_statistics(statistics: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Process team seasonal statistics from Sportmonks."""
-    result = {
-        "goals_scored": {"total": 0, "home": 0, "away": 0},
-        "goals_conceded": {"total": 0, "home": 0, "away": 0},
-        "clean_sheets": {"total": 0, "home": 0, "away": 0},
-        "wins": {"total": 0, "home": 0, "away": 0},
-        "draws": {"total": 0, "home": 0, "away": 0},
-        "losses": {"total": 0, "home": 0, "away": 0},
-        "scoring_minutes": {},
-        "conceding_minutes": {},
-    }
+    # Zeroed entries for every key the dispatch tables can fill
+    result = {key: {"total": 0, "home": 0, "away": 0} for key in TEAM_COUNT_STATS.values()}
+    result.update((key, {}) for key in TEAM_RAW_STATS.values())
 
     for stat_season in statistics:
         details = stat_season.get("details", [])
@@ -928,49 +1500,19 @@ def _process_team_statistics(statistics: List[Dict[str, Any]]) -> Dict[str, Any]
             type_id = detail.get("type_id")
             value = detail.get("value", {})
 
-            # Goals (type_id: 52)
-            if type_id == 52:
-                result["goals_scored"]["total"] = value.get("all", {}).get("count", 0)
-                result["goals_scored"]["home"] = value.get("home", {}).get("count", 0)
-                result["goals_scored"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Goals Conceded (type_id: 88)
-            elif type_id == 88:
-                result["goals_conceded"]["total"] = value.get("all", {}).get("count", 0)
-                result["goals_conceded"]["home"] = value.get("home", {}).get("count", 0)
-                result["goals_conceded"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Clean Sheets (type_id: 194)
-            elif type_id == 194:
-                result["clean_sheets"]["total"] = value.get("all", {}).get("count", 0)
-                result["clean_sheets"]["home"] = value.get("home", {}).get("count", 0)
-                result["clean_sheets"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Wins (type_id: 214)
-            elif type_id == 214:
-                result["wins"]["total"] = value.get("all", {}).get("count", 0)
-                result["wins"]["home"] = value.get("home", {}).get("count", 0)
-                result["wins"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Draws (type_id: 215)
-            elif type_id == 215:
-                result["draws"]["total"] = value.get("all", {}).get("count", 0)
-                result["draws"]["home"] = value.get("home", {}).get("count", 0)
-                result["draws"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Losses (type_id: 216)
-            elif type_id == 216:
-                result["losses"]["total"] = value.get("all", {}).get("count", 0)
-                result["losses"]["home"] = value.get("home", {}).get("count", 0)
-                result["losses"]["away"] = value.get("away", {}).get("count", 0)
-
-            # Scoring Minutes (type_id: 196)
-            elif type_id == 196:
-                result["scoring_minutes"] = value
-
-            # Conceding Minutes (type_id: 213)
-            elif type_id == 213:
-                result["conceding_minutes"] = value
+            key = TEAM_COUNT_STATS.get(type_id)
+            if key:
+                vget = value.get
+                result[key] = {
+                    "total": (vget("all") or _EMPTY).get("count", 0),
+                    "home": (vget("home") or _EMPTY).get("count", 0),
+                    "away": (vget("away") or _EMPTY).get("count", 0),
+                }
+                continue
+
+            key = TEAM_RAW_STATS.get(type_id)
+            if key:
+                result[key] = value
 
     return result
 
@@ -990,51 +1532,63 @@ def get_team_fixtures(
         upcoming: If True, get upcoming fixtures
         finished: If True, get finished fixtures
     """
-    from datetime import datetime, timedelta
+    window = _team_fixtures_window(team_id, upcoming)
+    if window is None:
+        return []
+    key, data, fixtures = window
 
-    includes = ["participants", "scores", "league", "venue", "state"]
+    # Filter by status on the raw fixtures, before any processing
+    candidates = []
+    for fixture in fixtures:
+        if upcoming:
+            if _state(fixture.get("state_id", 1))[1]:
+                continue
+        elif finished and not _state(fixture.get("state_id", 1))[1]:
+            continue
+        candidates.append(fixture)
 
-    # Use fixtures/between endpoint with date range
-    now = datetime.now()
-    if upcoming:
-        start_date = now
-        end_date = now + timedelta(days=60)  # Look ahead 60 days
-    else:
-        start_date = now - timedelta(days=90)  # Look back 90 days
-        end_date = now
+    # Partial sort: only the first `limit` are needed
+    # (ascending for upcoming, descending for past)
+    select = nsmallest if upcoming else nlargest
+    selected = select(limit, candidates, key=lambda x: x.get("starting_at") or "")
 
-    data = _make_request(
-        f"fixtures/between/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}/{team_id}",
-        include=includes
-    )
+    # Only the selected fixtures are processed, in light mode (list view)
+    return _process_fixtures_cached(key, data, selected, light=True)
 
-    if not data.get("data"):
-        return []
 
-    # Sort fixtures
-    fixtures_data = sorted(
-        data["data"],
-        key=lambda x: x.get("starting_at", ""),
-        reverse=not upcoming  # Descending for past, ascending for upcoming
-    )
+# Days covered by the shared team fixtures windows. Sportmonks caps a
+# per-team fixtures/between range at 100 days, so past and upcoming are
+# separate requests rather than one 150-day window.
+TEAM_WINDOW_DAYS_BACK = 90
+TEAM_WINDOW_DAYS_FORWARD = 60
 
-    fixtures = []
-    for fixture in fixtures_data:
-        processed = _process_fixture(fixture)
 
-        # Filter by status
-        state = processed.get("state", {})
-        if upcoming and state.get("is_finished"):
-            continue
-        if finished and not upcoming and not state.get("is_finished"):
-            continue
+def _team_fixtures_window(
+    team_id: int,
+    upcoming: bool = False,
+) -> Optional[Tuple[Tuple, Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Fetch a team's fixtures from 90 days back to today, or (upcoming=True)
+    from today to 60 days ahead.
 
-        fixtures.append(processed)
+    Past fixtures, recent matches and form share the past window; upcoming
+    fixtures and the next match share the upcoming one, so each is fetched
+    and cached once per team. Returns (processed cache key, response, raw
+    fixtures) or None when there is no data.
+    """
+    today = _now_cached().date()
+    if upcoming:
+        start_date, end_date = _date_str(today), _date_str(today, TEAM_WINDOW_DAYS_FORWARD)
+    else:
+        start_date, end_date = _date_str(today, -TEAM_WINDOW_DAYS_BACK), _date_str(today)
+    endpoint = f"fixtures/between/{start_date}/{end_date}/{team_id}"
+    params = {"per_page": 100}
+    data = _make_request(endpoint, params=params, include=TEAM_FIXTURES_INCLUDES)
 
-        if len(fixtures) >= limit:
-            break
+    if not data.get("data"):
+        return None
 
-    return fixtures
+    return (endpoint, TEAM_FIXTURES_INCLUDES), data, data["data"]
 
 
 def get_team_recent_matches(team_id: int, limit: int = 5) -> List[Dict[str, Any]]:
@@ -1042,37 +1596,9 @@ def get_team_recent_matches(team_id: int, limit: int = 5) -> List[Dict[str, Any]
     Get team's recent completed matches with full details.
     Returns matches formatted for the form section.
     """
-    from datetime import datetime, timedelta
-
-    # Use fixtures/between endpoint for team matches
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=90)  # Look back 90 days
-
-    data = _make_request(
-        f"fixtures/between/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}/{team_id}",
-        include=["participants", "scores", "league", "venue", "state"]
-    )
-
-    if not data.get("data"):
-        return []
-
-    # Sort by date descending
-    fixtures = sorted(
-        data["data"],
-        key=lambda x: x.get("starting_at", ""),
-        reverse=True
-    )
-
+    # Same 90-day window as get_team_fixtures, so both share one fetch and parse
     matches = []
-    for fixture in fixtures:
-        state_id = fixture.get("state_id", 0)
-        state = MATCH_STATES.get(state_id, {})
-
-        if not state.get("is_finished"):
-            continue
-
-        processed = _process_fixture(fixture)
-
+    for processed in get_team_fixtures(team_id, limit=limit, upcoming=False, finished=True):
         # Determine result from team's perspective
         home_team = processed.get("home_team", {})
         away_team = processed.get("away_team", {})
@@ -1103,36 +1629,59 @@ def get_team_recent_matches(team_id: int, limit: int = 5) -> List[Dict[str, Any]
             "venue": processed.get("venue"),
         })
 
-        if len(matches) >= limit:
-            break
-
     return matches
 
 
 def get_team_next_match(team_id: int) -> Optional[Dict[str, Any]]:
     """Get team's next upcoming match."""
-    from datetime import datetime, timedelta
+    window = _team_fixtures_window(team_id, upcoming=True)
+    if window is None:
+        return None
+    key, data, fixtures = window
 
-    # Use fixtures/between for upcoming matches
-    start_date = datetime.now()
-    end_date = start_date + timedelta(days=30)  # Look ahead 30 days
+    # Look ahead 30 days, in API (kickoff) order
+    today = _now_cached().date()
+    start_date, end_date = _date_str(today), _date_str(today, 30)
 
-    data = _make_request(
-        f"fixtures/between/{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}/{team_id}",
-        include=["participants", "league", "venue", "state"]
-    )
+    for fixture in fixtures:
+        if not start_date <= (fixture.get("starting_at") or "")[:10] <= end_date:
+            continue
+        _, is_finished, is_live = _state(fixture.get("state_id", 0))
 
-    if not data.get("data"):
-        return None
+        if not is_finished and not is_live:
+            return _process_fixtures_cached(key, data, [fixture], light=True)[0]
 
-    for fixture in data["data"]:
-        state_id = fixture.get("state_id", 0)
-        state = MATCH_STATES.get(state_id, {})
+    return None
 
-        if not state.get("is_finished") and not state.get("is_live"):
-            return _process_fixture(fixture)
 
-    return None
+# Sportmonks standing detail type IDs (from live standings):
+# 129=games_played, 130=won, 131=draw, 132=lost, 133=goals_for, 134=goals_against
+# 138=position, 139=wins_home, 140=wins_away, 141=draws_home, 142=draws_away
+# 143=lost_home, 144=lost_away, 145=goals_scored_home, 146=goals_scored_away
+# 147=goals_conceded_home, 148=goals_conceded_away, 179=goal_diff
+STANDING_DETAIL_FIELDS = {
+    129: "played",
+    130: "won",
+    131: "drawn",
+    132: "lost",
+    133: "goals_for",
+    134: "goals_against",
+    179: "goal_diff",
+    # Home/away breakdowns, used for totals if main fields are missing
+    139: "won_home",
+    140: "won_away",
+    145: "goals_for_home",
+    146: "goals_for_away",
+    147: "goals_against_home",
+    148: "goals_against_away",
+}
+
+# Breakdown fields keep the first value seen for a row
+STANDING_BREAKDOWN_FIELDS = frozenset({
+    "won_home", "won_away",
+    "goals_for_home", "goals_for_away",
+    "goals_against_home", "goals_against_away",
+})
 
 
 def get_standings(
@@ -1153,87 +1702,66 @@ def get_standings(
     else:
         return []
 
-    data = _make_request(endpoint, include=["participant", "details"])
+    data = _make_request(endpoint, include=STANDINGS_INCLUDES)
 
     if not data.get("data"):
         return []
 
     standings = []
+    sort_keys = []  # Position per row, collected while building
     for row in data["data"]:
-        participant = row.get("participant", {})
+        rget = row.get
+        participant = rget("participant", {})
+        pget = participant.get
 
         # Extract stats from details array (Sportmonks stores stats in details)
-        details = row.get("details", [])
+        details = rget("details", [])
         stats = {}
         for detail in details:
-            type_id = detail.get("type_id")
-            value = detail.get("value")
-            # Sportmonks standing type IDs (from live standings):
-            # 129=games_played, 130=won, 131=draw, 132=lost, 133=goals_for, 134=goals_against
-            # 138=position, 139=wins_home, 140=wins_away, 141=draws_home, 142=draws_away
-            # 143=lost_home, 144=lost_away, 145=goals_scored_home, 146=goals_scored_away
-            # 147=goals_conceded_home, 148=goals_conceded_away, 179=goal_diff
-            if type_id == 129:
-                stats["played"] = value
-            elif type_id == 130:
-                stats["won"] = value
-            elif type_id == 131:
-                stats["drawn"] = value
-            elif type_id == 132:
-                stats["lost"] = value
-            elif type_id == 133:
-                stats["goals_for"] = value
-            elif type_id == 134:
-                stats["goals_against"] = value
-            elif type_id == 179:
-                stats["goal_diff"] = value
-            # Also capture home/away breakdowns for totals if main fields missing
-            elif type_id == 139:  # wins_home
-                stats.setdefault("won_home", value)
-            elif type_id == 140:  # wins_away
-                stats.setdefault("won_away", value)
-            elif type_id == 145:  # goals_scored_home
-                stats.setdefault("goals_for_home", value)
-            elif type_id == 146:  # goals_scored_away
-                stats.setdefault("goals_for_away", value)
-            elif type_id == 147:  # goals_conceded_home
-                stats.setdefault("goals_against_home", value)
-            elif type_id == 148:  # goals_conceded_away
-                stats.setdefault("goals_against_away", value)
+            key = STANDING_DETAIL_FIELDS.get(detail.get("type_id"))
+            if key is None:
+                continue
+            if key in STANDING_BREAKDOWN_FIELDS:
+                stats.setdefault(key, detail.get("value"))
+            else:
+                stats[key] = detail.get("value")
+
+        sget = stats.get
 
         # Fall back to direct fields if details are empty, or calculate from home/away
-        won = stats.get("won") or row.get("won") or row.get("wins")
+        won = sget("won") or rget("won") or rget("wins")
         if won is None and "won_home" in stats and "won_away" in stats:
-            won = (stats.get("won_home") or 0) + (stats.get("won_away") or 0)
+            won = (sget("won_home") or 0) + (sget("won_away") or 0)
 
-        drawn = stats.get("drawn") or row.get("draw") or row.get("draws")
-        lost = stats.get("lost") or row.get("lost") or row.get("losses")
+        drawn = sget("drawn") or rget("draw") or rget("draws")
+        lost = sget("lost") or rget("lost") or rget("losses")
 
-        goals_for = stats.get("goals_for") or row.get("goals_scored") or row.get("goals_for")
+        goals_for = sget("goals_for") or rget("goals_scored") or rget("goals_for")
         if goals_for is None and "goals_for_home" in stats and "goals_for_away" in stats:
-            goals_for = (stats.get("goals_for_home") or 0) + (stats.get("goals_for_away") or 0)
+            goals_for = (sget("goals_for_home") or 0) + (sget("goals_for_away") or 0)
 
-        goals_against = stats.get("goals_against") or row.get("goals_conceded") or row.get("goals_against")
+        goals_against = sget("goals_against") or rget("goals_conceded") or rget("goals_against")
         if goals_against is None and "goals_against_home" in stats and "goals_against_away" in stats:
-            goals_against = (stats.get("goals_against_home") or 0) + (stats.get("goals_against_away") or 0)
+            goals_against = (sget("goals_against_home") or 0) + (sget("goals_against_away") or 0)
 
-        played = stats.get("played") or row.get("played") or row.get("games_played")
+        played = sget("played") or rget("played") or rget("games_played")
         # Calculate played from W+D+L if not directly available
+        # (all three are known non-None here, so no None->0 guards needed)
         if played is None and won is not None and drawn is not None and lost is not None:
-            played = (won or 0) + (drawn or 0) + (lost or 0)
+            played = won + drawn + lost
 
-        goal_diff = stats.get("goal_diff") or row.get("goal_difference")
+        goal_diff = sget("goal_diff") or rget("goal_difference")
 
         # Calculate goal diff if not provided
         if goal_diff is None and goals_for is not None and goals_against is not None:
-            goal_diff = (goals_for or 0) - (goals_against or 0)
+            goal_diff = goals_for - goals_against
 
         standings.append({
-            "position": row.get("position"),
-            "team_id": participant.get("id"),
-            "team_name": participant.get("name"),
-            "team_short": participant.get("short_code") or _get_short_code(participant.get("name", "")),
-            "team_logo": participant.get("image_path"),
+            "position": rget("position"),
+            "team_id": pget("id"),
+            "team_name": pget("name"),
+            "team_short": pget("short_code") or _get_short_code(pget("name", "")),
+            "team_logo": pget("image_path"),
             "played": played,
             "won": won,
             "drawn": drawn,
@@ -1241,13 +1769,31 @@ def get_standings(
             "goals_for": goals_for,
             "goals_against": goals_against,
             "goal_diff": goal_diff,
-            "points": row.get("points"),
-            "form": row.get("recent_form"),
+            "points": rget("points"),
+            "form": rget("recent_form"),
         })
+        sort_keys.append(rget("position") or 999)
+
+    # Sort by position (index sort on the precomputed keys)
+    order = sorted(range(len(standings)), key=sort_keys.__getitem__)
+    return [standings[i] for i in order]
+
+
+# Squad detail developer_name -> (stats key, value field)
+SQUAD_STAT_FIELDS = {
+    "GOALS": ("goals", "total"),
+    "ASSISTS": ("assists", "total"),
+    "RATING": ("rating", "average"),
+    "APPEARANCES": ("appearances", "total"),
+}
 
-    # Sort by position
-    standings.sort(key=lambda x: x.get("position") or 999)
-    return standings
+# Squad position_id -> position code
+SQUAD_POSITION_CODES = {
+    24: "G",  # Goalkeeper
+    25: "D",  # Defender
+    26: "M",  # Midfielder
+    27: "F",  # Forward/Attacker
+}
 
 
 def get_team_squad(team_id: int, season_id: int = None) -> List[Dict[str, Any]]:
@@ -1263,7 +1809,7 @@ def get_team_squad(team_id: int, season_id: int = None) -> List[Dict[str, Any]]:
     else:
         endpoint = f"squads/teams/{team_id}"
 
-    data = _make_request(endpoint, include=["player"])
+    data = _make_request(endpoint, include=SQUAD_INCLUDES)
 
     if not data.get("data"):
         return []
@@ -1276,28 +1822,14 @@ def get_team_squad(team_id: int, season_id: int = None) -> List[Dict[str, Any]]:
         # Extract stats from details
         stats = {}
         for detail in details:
-            type_info = detail.get("type", {})
-            type_name = type_info.get("developer_name", "")
-            value = detail.get("value", {})
-
-            if type_name == "GOALS":
-                stats["goals"] = value.get("total", 0)
-            elif type_name == "ASSISTS":
-                stats["assists"] = value.get("total", 0)
-            elif type_name == "RATING":
-                stats["rating"] = value.get("average", 0)
-            elif type_name == "APPEARANCES":
-                stats["appearances"] = value.get("total", 0)
+            field = SQUAD_STAT_FIELDS.get(detail.get("type", {}).get("developer_name", ""))
+            if field:
+                key, value_key = field
+                stats[key] = detail.get("value", {}).get(value_key, 0)
 
         # Map position_id to position name
-        position_map = {
-            24: "G",  # Goalkeeper
-            25: "D",  # Defender
-            26: "M",  # Midfielder
-            27: "F",  # Forward/Attacker
-        }
         position_id = item.get("position_id") or player.get("position_id")
-        position = position_map.get(position_id, "M")  # Default to Midfielder
+        position = SQUAD_POSITION_CODES.get(position_id, "M")  # Default to Midfielder
 
         players.append({
             "id": player.get("id"),
@@ -1316,11 +1848,13 @@ def get_team_squad(team_id: int, season_id: int = None) -> List[Dict[str, Any]]:
 
 def get_team_top_scorers(team_id: int, season_id: int = None, limit: int = 5) -> List[Dict[str, Any]]:
     """Get team's top scorers for the season."""
-    squad = get_team_squad(team_id, season_id)
+    return _top_scorers(get_team_squad(team_id, season_id), limit)
+
 
-    # Sort by goals
-    scorers = sorted(squad, key=lambda p: p.get("stats", {}).get("goals", 0), reverse=True)
-    return scorers[:limit]
+def _top_scorers(squad: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Pick the top scorers from an already-fetched squad."""
+    # Top `limit` by goals (same order as a full descending sort)
+    return nlargest(limit, squad, key=lambda p: p.get("stats", {}).get("goals", 0))
 
 
 def get_current_streak(team_id: int) -> Dict[str, Any]:
@@ -1330,8 +1864,11 @@ def get_current_streak(team_id: int) -> Dict[str, Any]:
     Returns:
         Dict with streak_type ("W", "D", "L") and count
     """
-    form = get_team_form(team_id, limit=10)
+    return _streak_from_form(get_team_form(team_id, limit=10))
+
 
+def _streak_from_form(form: List[str]) -> Dict[str, Any]:
+    """Calculate the current streak from a most-recent-first form list."""
     if not form:
         return {"type": None, "count": 0, "display": "-"}
 
@@ -1351,6 +1888,38 @@ def get_current_streak(team_id: int) -> Dict[str, Any]:
     }
 
 
+def get_team_hub_data(team_id: int, recent_limit: int = 5) -> Dict[str, Any]:
+    """
+    Fetch the independent Team Hub sections concurrently.
+
+    The requests are I/O bound, so overlapping them makes the page cost
+    roughly the slowest single request instead of the sum. Top scorers
+    and streak are derived from the squad and form fetches rather than
+    re-requesting them.
+
+    Returns:
+        Dict with team, league_info, recent_matches (up to recent_limit),
+        next_match, squad, top_scorers (top 3) and streak.
+    """
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        team = executor.submit(get_team_details, team_id)
+        league_info = executor.submit(get_team_league_info, team_id)
+        recent_matches = executor.submit(get_team_recent_matches, team_id, recent_limit)
+        next_match = executor.submit(get_team_next_match, team_id)
+        squad = executor.submit(get_team_squad, team_id)
+        form = executor.submit(get_team_form, team_id, 10)
+
+    return {
+        "team": team.result(),
+        "league_info": league_info.result(),
+        "recent_matches": recent_matches.result(),
+        "next_match": next_match.result(),
+        "squad": squad.result(),
+        "top_scorers": _top_scorers(squad.result(), 3),
+        "streak": _streak_from_form(form.result()),
+    }
+
+
 def get_team_league_info(team_id: int) -> Optional[Dict[str, Any]]:
     """
     Get the primary league info for a team.
@@ -1358,7 +1927,7 @@ def get_team_league_info(team_id: int) -> Optional[Dict[str, Any]]:
     """
     data = _make_request(
         f"teams/{team_id}/current-leagues",
-        include=["currentSeason"]
+        include=TEAM_LEAGUES_INCLUDES
     )
 
     if not data.get("data"):
@@ -1394,6 +1963,26 @@ def get_team_league_info(team_id: int) -> Optional[Dict[str, Any]]:
     return None
 
 
+# (start, end) day offsets from today for get_league_fixtures. Past fixtures
+# go back ~120 days (half a season) so historical rounds (like 20-23) have
+# their actual fixture data; upcoming covers ~60 days (2+ weekends guaranteed).
+LEAGUE_FIXTURE_WINDOWS = (
+    (-120, -105),
+    (-105, -70),
+    (-70, -35),
+    (-35, 0),   # Recent fixtures (past 35 days)
+    (0, 35),
+    (35, 60),
+)
+
+# Score periods whose goals count as the score in league fixture lists
+LEAGUE_SCORE_DESCRIPTIONS = frozenset({"CURRENT", "2ND_HALF", "LIVE"})
+
+# English day/month abbreviations for fixture list dates ("Sat, Mar 7")
+WEEKDAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
 def get_league_fixtures(
     league_id: int,
     limit: int = 50
@@ -1405,78 +1994,56 @@ def get_league_fixtures(
     Returns:
         Dict with 'fixtures', 'recent_fixtures', and 'current_round'
     """
-    from datetime import datetime, timedelta
-
     # Get fixtures - Sportmonks allows max 35 day range per request
     # We'll make multiple requests to cover sufficient range
-    now = datetime.now()
-
-    # Past fixtures - fetch in 35-day chunks going back ~120 days (half a season)
-    # This ensures historical rounds (like 20-23) have their actual fixture data
-    past_start_4 = (now - timedelta(days=120)).strftime('%Y-%m-%d')
-    past_end_4 = (now - timedelta(days=105)).strftime('%Y-%m-%d')
-
-    past_start_3 = (now - timedelta(days=105)).strftime('%Y-%m-%d')
-    past_end_3 = (now - timedelta(days=70)).strftime('%Y-%m-%d')
-
-    past_start_2 = (now - timedelta(days=70)).strftime('%Y-%m-%d')
-    past_end_2 = (now - timedelta(days=35)).strftime('%Y-%m-%d')
-
-    # Recent fixtures (past 35 days)
-    recent_start = (now - timedelta(days=35)).strftime('%Y-%m-%d')
-    recent_end = now.strftime('%Y-%m-%d')
-
-    # Upcoming fixtures - two 35-day chunks to get ~60 days ahead (2+ weekends guaranteed)
-    upcoming_start = now.strftime('%Y-%m-%d')
-    upcoming_mid = (now + timedelta(days=35)).strftime('%Y-%m-%d')
-    upcoming_end = (now + timedelta(days=60)).strftime('%Y-%m-%d')
-
-    # Fetch fixtures from both date ranges
-    all_raw_fixtures = []
-    seen_ids = set()
-
-    # Helper to fetch from a date range
-    def fetch_range(start, end):
+    today = _now_cached().date()
+    ranges = [
+        (_date_str(today, start), _date_str(today, end))
+        for start, end in LEAGUE_FIXTURE_WINDOWS
+    ]
+
+    # Helper to fetch this league's fixtures from a date range
+    def fetch_range(date_range):
+        start, end = date_range
+        fixtures = []
         page = 1
         max_pages = 5
         while page <= max_pages:
+            # Filtered to this league server-side, so only its fixtures ship
             data = _make_request(
                 f"fixtures/between/{start}/{end}",
                 params={"per_page": 100, "page": page},
-                include=["participants", "scores", "state", "round", "league"]
+                include=LEAGUE_FIXTURES_INCLUDES,
+                filters={"fixtureLeagues": [league_id]},
             )
             if not data.get("data"):
                 break
 
-            # Filter for this league
-            for fixture in data["data"]:
-                fid = fixture.get("id")
-                if fid and fid not in seen_ids:
-                    if fixture.get("league_id") == league_id or fixture.get("league", {}).get("id") == league_id:
-                        all_raw_fixtures.append(fixture)
-                        seen_ids.add(fid)
+            fixtures.extend(fixture for fixture in data["data"] if fixture.get("id"))
 
             # Check pagination
             pagination = data.get("pagination", {})
             if page >= pagination.get("last_page", 1):
                 break
             page += 1
+        return fixtures
 
-    # Fetch past fixtures (4 chunks going back 120 days)
-    fetch_range(past_start_4, past_end_4)
-    fetch_range(past_start_3, past_end_3)
-    fetch_range(past_start_2, past_end_2)
-    fetch_range(recent_start, recent_end)
-
-    # Fetch upcoming fixtures (2 chunks for 60 days ahead)
-    fetch_range(upcoming_start, upcoming_mid)
-    fetch_range(upcoming_mid, upcoming_end)
+    # The ranges are independent - fetch them concurrently, then merge in
+    # range order so fixtures on a shared boundary day are kept once
+    all_raw_fixtures = []
+    seen_ids = set()
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        for fixtures in executor.map(fetch_range, ranges):
+            for fixture in fixtures:
+                fid = fixture["id"]
+                if fid not in seen_ids:
+                    all_raw_fixtures.append(fixture)
+                    seen_ids.add(fid)
 
     if not all_raw_fixtures:
         return {"fixtures": [], "recent_fixtures": [], "current_round": None}
 
     all_fixtures = []
-    current_round = None
 
     for fixture in all_raw_fixtures:
         # Parse the fixture date
@@ -1485,18 +2052,17 @@ def get_league_fixtures(
             continue
 
         try:
-            fixture_dt = datetime.fromisoformat(starting_at.replace("Z", "+00:00"))
-            fixture_date = fixture_dt.date()
-        except:
+            fixture_dt = _parse_datetime(starting_at)
+        except (AttributeError, TypeError, ValueError):
             continue
+        fixture_date = fixture_dt.date()
 
         # Get participants
         participants = fixture.get("participants", [])
         home_team = None
         away_team = None
         for p in participants:
-            meta = p.get("meta", {})
-            if meta.get("location") == "home":
+            if _location(p) == "home":
                 home_team = p
             else:
                 away_team = p
@@ -1504,46 +2070,36 @@ def get_league_fixtures(
         if not home_team or not away_team:
             continue
 
-        # Get scores
-        scores = fixture.get("scores", [])
-        home_score = None
-        away_score = None
-        for score in scores:
-            desc = score.get("description", "")
-            if desc in ["CURRENT", "2ND_HALF", "LIVE"]:
-                participant_id = score.get("participant_id")
-                if participant_id == home_team.get("id"):
-                    home_score = score.get("score", {}).get("goals")
-                elif participant_id == away_team.get("id"):
-                    away_score = score.get("score", {}).get("goals")
+        home_id = home_team.get("id")
+        away_id = away_team.get("id")
+
+        # Get scores (participant_id -> goals; the last matching period wins)
+        goals_by_participant = {
+            score.get("participant_id"): score.get("score", {}).get("goals")
+            for score in fixture.get("scores", [])
+            if score.get("description", "") in LEAGUE_SCORE_DESCRIPTIONS
+        }
+        home_score = goals_by_participant.get(home_id)
+        away_score = goals_by_participant.get(away_id) if away_id != home_id else None
 
         # Get match state
         state = fixture.get("state", {})
         state_id = state.get("id") if state else fixture.get("state_id")
-        match_state = MATCH_STATES.get(state_id, {"short": "NS", "is_live": False, "is_finished": False})
+        match_state, is_finished, is_live = _state(state_id)
 
         # Get round info
         round_info = fixture.get("round", {})
         round_number = round_info.get("name") or round_info.get("id")
 
-        # Track current round (latest round with finished/live matches)
-        if match_state["is_finished"] or match_state["is_live"]:
-            if round_number:
-                try:
-                    round_num = int(round_number)
-                    if current_round is None or round_num > current_round:
-                        current_round = round_num
-                except:
-                    pass
-
         # Format time
-        time_str = fixture_dt.strftime("%H:%M")
+        time_str = f"{fixture_dt.hour:02d}:{fixture_dt.minute:02d}"
         time_period = "PM" if fixture_dt.hour >= 12 else "AM"
 
         # Day name
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        date_str = f"{days[fixture_date.weekday()]}, {months[fixture_date.month - 1]} {fixture_date.day}"
+        date_str = (
+            f"{WEEKDAY_ABBRS[fixture_date.weekday()]}, "
+            f"{MONTH_ABBRS[fixture_date.month - 1]} {fixture_date.day}"
+        )
 
         fixture_data = {
             "id": fixture.get("id"),
@@ -1551,26 +2107,26 @@ def get_league_fixtures(
             "date_str": date_str,
             "time_str": time_str,
             "time_period": time_period,
-            "home_id": home_team.get("id"),
+            "home_id": home_id,
             "home_name": home_team.get("name"),
             "home_short": home_team.get("short_code") or home_team.get("name", "")[:3].upper(),
             "home_logo": home_team.get("image_path"),
             "home_score": home_score,
-            "away_id": away_team.get("id"),
+            "away_id": away_id,
             "away_name": away_team.get("name"),
             "away_short": away_team.get("short_code") or away_team.get("name", "")[:3].upper(),
             "away_logo": away_team.get("image_path"),
             "away_score": away_score,
             "status_short": match_state["short"],
-            "is_live": match_state["is_live"],
-            "is_finished": match_state["is_finished"],
+            "is_live": is_live,
+            "is_finished": is_finished,
             "round": round_number,
         }
 
         all_fixtures.append(fixture_data)
 
     # Sort by date
-    all_fixtures.sort(key=lambda x: x["date"])
+    all_fixtures.sort(key=itemgetter("date"))
 
     # Split into recent (finished) and upcoming/all
     recent_fixtures = [f for f in all_fixtures if f["is_finished"]]
@@ -1579,33 +2135,23 @@ def get_league_fixtures(
 
     # Group fixtures by round
     fixtures_by_round = {}
-    available_rounds = set()
     for f in all_fixtures:
         r = f.get("round")
         if r:
             try:
                 round_num = int(r)
-                available_rounds.add(round_num)
-                if round_num not in fixtures_by_round:
-                    fixtures_by_round[round_num] = []
-                fixtures_by_round[round_num].append(f)
             except (ValueError, TypeError):
-                pass
-
-    # Sort available rounds
-    available_rounds = sorted(available_rounds)
+                continue
+            fixtures_by_round.setdefault(round_num, []).append(f)
 
     # Fill in missing rounds sequentially between min and max
     # This ensures navigation goes 19, 20, 21, 22, 23, 24 instead of jumping
-    if available_rounds:
-        min_round = min(available_rounds)
-        max_round = max(available_rounds)
-        # Create sequential list from min to max
-        available_rounds = list(range(min_round, max_round + 1))
+    available_rounds = []
+    if fixtures_by_round:
+        available_rounds = list(range(min(fixtures_by_round), max(fixtures_by_round) + 1))
         # Add empty entries for missing rounds in fixtures_by_round
         for r in available_rounds:
-            if r not in fixtures_by_round:
-                fixtures_by_round[r] = []
+            fixtures_by_round.setdefault(r, [])
 
     # Determine current round (latest round with any finished or live matches)
     current_round = None
@@ -17,7 +17,8 @@ def safe_str(value: Any, default: str = "") -> str:
     """
     if value is None:
         return default
-    return str(value)
+    # Most API fields are already str - skip the str() call for them
+    return value if type(value) is str else str(value)
 
 
 def safe_lower(value: Any) -> str:
@@ -32,6 +33,8 @@ def safe_lower(value: Any) -> str:
     """
     if value is None:
         return ""
+    if type(value) is str:
+        return value.lower()
     return str(value).lower()
 
 
@@ -47,6 +50,8 @@ def safe_strip(value: Any) -> str:
     """
     if value is None:
         return ""
+    if type(value) is str:
+        return value.strip()
     return str(value).strip()
 
 
@@ -10,14 +10,87 @@ Tracks search queries to identify:
 This data helps improve the search system over time.
 """
 
+import atexit
 import json
 import os
-from datetime import datetime
+import queue
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from heapq import nlargest
 import threading
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Records only mark the stores dirty; a background thread writes them once
+# ANALYTICS_BATCH_SIZE records are pending or ANALYTICS_BATCH_MS after the
+# first pending record, whichever comes first.
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "32"))
+ANALYTICS_BATCH_MS = int(os.getenv("ANALYTICS_BATCH_MS", "50"))
+
+# fsync analytics files before swapping them in (off by default - the data
+# is advisory and the atomic rename already protects against torn files)
+ANALYTICS_FSYNC = os.getenv("ANALYTICS_FSYNC", "0") == "1"
+
+# Updated entries are appended to a JSONL events log; after this many events
+# the snapshots are rewritten and the log truncated (compaction)
+ANALYTICS_COMPACT_EVERY = int(os.getenv("ANALYTICS_COMPACT_EVERY", "1000"))
+
+# record_search_result hands records to a background recorder thread. Once
+# this many are queued, popularity (successful) records are dropped; at
+# twice this many, all new records are dropped.
+ANALYTICS_QUEUE_MAX = int(os.getenv("ANALYTICS_QUEUE_MAX", "10000"))
+
+# Failed / low-confidence stores keep at most this many queries each; the
+# least recently seen query is evicted first
+ANALYTICS_MAX_ENTRIES = int(os.getenv("ANALYTICS_MAX_ENTRIES", "50000"))
+
+# Events log store names -> SearchAnalytics attribute holding that store
+EVENT_STORES = {
+    "failed": "_failed_queries",
+    "low_confidence": "_low_confidence",
+}
+
+
+def _json_dumps(data: Any) -> str:
+    """Compact JSON text (orjson when installed; non-ASCII kept as-is)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON text (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _query_key(query: str) -> str:
+    """Normalized store key for a query."""
+    return query.lower().strip()
+
+
+# (epoch second, ISO string) for _now_iso; swapped as one tuple
+_now_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as a naive ISO string, formatted at most once per second."""
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, text = _now_iso_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+        _now_iso_cache = (second, text)
+    return text
+
 
 class SearchAnalytics:
     """
@@ -39,49 +112,241 @@ class SearchAnalytics:
         self.failed_queries_file = self.data_dir / "failed_queries.json"
         self.low_confidence_file = self.data_dir / "low_confidence_queries.json"
         self.query_log_file = self.data_dir / "query_log.json"
+        self.events_file = self.data_dir / "analytics_events.jsonl"
 
-        # In-memory caches
-        self._failed_queries: Dict[str, Dict] = {}
-        self._low_confidence: Dict[str, Dict] = {}
+        # In-memory caches, least recently seen first (see ANALYTICS_MAX_ENTRIES)
+        self._failed_queries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._low_confidence: "OrderedDict[str, Dict]" = OrderedDict()
         self._query_counts: Dict[str, int] = defaultdict(int)
-
-        # Thread safety
-        self._lock = threading.Lock()
+        # Failure reason -> number of kept reason entries in _failed_queries
+        self._reason_counts: Dict[str, int] = defaultdict(int)
+
+        # Thread safety: one lock per structure so recording into different
+        # stores does not serialize. When several are needed they are taken
+        # in the order failed -> low confidence -> events.
+        self._failed_lock = threading.Lock()
+        self._lowconf_lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+        self._events_lock = threading.Lock()
+
+        # Batched persistence (see ANALYTICS_BATCH_SIZE / ANALYTICS_BATCH_MS):
+        # serialized event lines waiting to be appended to the events log
+        self._pending_events: List[str] = []
+        self._events_since_compact = 0
+        self._events_fp = None
+        self._flush_requested = threading.Event()
+        self._batch_full = threading.Event()
+        self._flush_lock = threading.Lock()
+
+        # Records queued by record_async as (record method, kwargs)
+        self._record_queue: "queue.SimpleQueue" = queue.SimpleQueue()
 
         # Load existing data
         self._load_data()
 
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="search-analytics-flush", daemon=True
+        )
+        self._flusher.start()
+        self._recorder = threading.Thread(
+            target=self._record_loop, name="search-analytics-record", daemon=True
+        )
+        self._recorder.start()
+        atexit.register(self.flush)
+
     def _load_data(self):
         """Load existing analytics data from disk."""
         try:
             if self.failed_queries_file.exists():
                 with open(self.failed_queries_file, 'r', encoding='utf-8') as f:
-                    self._failed_queries = json.load(f)
+                    self._failed_queries = OrderedDict(_json_loads(f.read()))
         except (json.JSONDecodeError, IOError):
-            self._failed_queries = {}
+            self._failed_queries = OrderedDict()
 
         try:
             if self.low_confidence_file.exists():
                 with open(self.low_confidence_file, 'r', encoding='utf-8') as f:
-                    self._low_confidence = json.load(f)
+                    self._low_confidence = OrderedDict(_json_loads(f.read()))
         except (json.JSONDecodeError, IOError):
-            self._low_confidence = {}
+            self._low_confidence = OrderedDict()
 
-    def _save_failed_queries(self):
-        """Persist failed queries to disk."""
+        # Replay entries updated since the last compaction (last one wins,
+        # a null entry is an eviction)
         try:
-            with open(self.failed_queries_file, 'w', encoding='utf-8') as f:
-                json.dump(self._failed_queries, f, indent=2, ensure_ascii=False)
+            if self.events_file.exists():
+                with open(self.events_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            event = _json_loads(line)
+                            store = getattr(self, EVENT_STORES[event["store"]])
+                            key, entry = event["key"], event["entry"]
+                            if entry is None:
+                                store.pop(key, None)
+                            else:
+                                store[key] = entry
+                                store.move_to_end(key)
+                        except (json.JSONDecodeError, KeyError, TypeError):
+                            # Torn or unknown line: compact on the next flush
+                            # so new events are never appended after it
+                            self._events_since_compact = ANALYTICS_COMPACT_EVERY
+                            continue
+                        self._events_since_compact += 1
         except IOError:
+            pass
+
+        # Apply the cap in case ANALYTICS_MAX_ENTRIES was lowered since the
+        # files were written (persisted by the next compaction)
+        for store in (self._failed_queries, self._low_confidence):
+            while len(store) > ANALYTICS_MAX_ENTRIES:
+                store.popitem(last=False)
+
+        for entry in self._failed_queries.values():
+            self._count_reasons(entry.get("reasons", []), 1)
+
+    @staticmethod
+    def _serialize(data: Dict[str, Dict]) -> str:
+        """Compact JSON for the analytics files (no indentation)."""
+        # Plain dict copy: orjson writes an OrderedDict in insertion order,
+        # not its move_to_end (least recently seen first) order
+        return _json_dumps(dict(data))
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        """Write text to a temp file and swap it in, so readers never see a torn file."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+                if ANALYTICS_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
             pass  # Non-critical, continue
 
-    def _save_low_confidence(self):
-        """Persist low confidence queries to disk."""
+    def _record_event(self, store: str, key: str, entry: Dict):
+        """Queue an updated entry for the events log and wake the flusher (call with the store's lock held)."""
+        line = _json_dumps({"store": store, "key": key, "entry": entry}) + "\n"
+        with self._events_lock:
+            self._pending_events.append(line)
+            batch_full = len(self._pending_events) >= ANALYTICS_BATCH_SIZE
+        self._flush_requested.set()
+        if batch_full:
+            self._batch_full.set()
+
+    def _evict_overflow(self, store: str, data: "OrderedDict[str, Dict]"):
+        """Drop the least recently seen entries beyond ANALYTICS_MAX_ENTRIES (call with the store's lock held)."""
+        while len(data) > ANALYTICS_MAX_ENTRIES:
+            key, entry = data.popitem(last=False)
+            if store == "failed":
+                self._count_reasons(entry.get("reasons", []), -1)
+            self._record_event(store, key, None)
+
+    def _count_reasons(self, reasons: List[Dict], delta: int):
+        """Add delta to _reason_counts for each reason entry (call with _failed_lock held)."""
+        counts = self._reason_counts
+        for r in reasons:
+            reason = r.get("reason", "unknown")
+            counts[reason] += delta
+            if not counts[reason]:
+                del counts[reason]
+
+    def _flush_loop(self):
+        """Background flusher: wait for a record, then for the batch to fill or time out."""
+        while True:
+            self._flush_requested.wait()
+            self._batch_full.wait(ANALYTICS_BATCH_MS / 1000)
+            self._flush_requested.clear()
+            self._batch_full.clear()
+            self._write_pending()
+
+    def record_async(self, record, kwargs: Dict[str, Any], low_priority: bool = False):
+        """
+        Queue a call to one of the record_* methods for the recorder thread.
+
+        Returns immediately; records are dropped rather than queued without
+        bound (low_priority ones first, see ANALYTICS_QUEUE_MAX).
+        """
+        pending = self._record_queue.qsize()
+        if pending >= ANALYTICS_QUEUE_MAX * 2 or (low_priority and pending >= ANALYTICS_QUEUE_MAX):
+            return
+        self._record_queue.put((record, kwargs))
+
+    def _apply_record(self, item):
+        """Run one queued record; errors are dropped so the recorder keeps running."""
+        record, kwargs = item
         try:
-            with open(self.low_confidence_file, 'w', encoding='utf-8') as f:
-                json.dump(self._low_confidence, f, indent=2, ensure_ascii=False)
-        except IOError:
-            pass
+            record(**kwargs)
+        except Exception:
+            pass  # Non-critical, continue
+
+    def _record_loop(self):
+        """Background recorder: apply queued records in order."""
+        while True:
+            self._apply_record(self._record_queue.get())
+
+    def _drain_queue(self):
+        """Apply any records still queued (for flushing on demand / at exit)."""
+        while True:
+            try:
+                item = self._record_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._apply_record(item)
+
+    def flush(self, compact: bool = False):
+        """Apply records still queued by record_async, then write pending records to disk now."""
+        self._drain_queue()
+        self._write_pending(compact)
+
+    def _write_pending(self, compact: bool = False):
+        """
+        Write pending records to disk.
+
+        Normally this appends the pending events to the events log. Every
+        ANALYTICS_COMPACT_EVERY events (or with compact=True) the snapshots
+        are rewritten instead and the log is truncated.
+        """
+        with self._flush_lock:
+            # Serialize under the locks, write after releasing them so
+            # recording is not blocked on disk I/O
+            with self._events_lock:
+                compact = compact or (
+                    self._events_since_compact + len(self._pending_events)
+                    >= ANALYTICS_COMPACT_EVERY
+                )
+                if not compact:
+                    lines = self._pending_events
+                    self._pending_events = []
+                    self._events_since_compact += len(lines)
+
+            if compact:
+                # Snapshots must match the events they replace, so hold both
+                # store locks while draining the queue
+                with self._failed_lock, self._lowconf_lock:
+                    with self._events_lock:
+                        self._pending_events = []
+                        self._events_since_compact = 0
+                    failed_text = self._serialize(self._failed_queries)
+                    low_conf_text = self._serialize(self._low_confidence)
+
+            try:
+                if compact:
+                    # Snapshots already include the pending events
+                    self._write_atomic(self.failed_queries_file, failed_text)
+                    self._write_atomic(self.low_confidence_file, low_conf_text)
+                    if self._events_fp is not None:
+                        self._events_fp.close()
+                    self._events_fp = open(self.events_file, 'w', encoding='utf-8')
+                elif lines:
+                    if self._events_fp is None:
+                        self._events_fp = open(self.events_file, 'a', encoding='utf-8')
+                    self._events_fp.writelines(lines)
+                    self._events_fp.flush()
+                    if ANALYTICS_FSYNC:
+                        os.fsync(self._events_fp.fileno())
+            except OSError:
+                pass  # Non-critical, continue
 
     def record_failed_query(
         self,
@@ -101,25 +366,28 @@ class SearchAnalytics:
             entities_found: What entities were extracted (if any)
             error_message: Specific error message
         """
-        query_lower = query.lower().strip()
+        query_lower = _query_key(query)
+        now_iso = _now_iso()
 
-        with self._lock:
-            if query_lower not in self._failed_queries:
-                self._failed_queries[query_lower] = {
+        with self._failed_lock:
+            entry = self._failed_queries.get(query_lower)
+            if entry is None:
+                entry = self._failed_queries[query_lower] = {
                     "query": query,
-                    "first_seen": datetime.utcnow().isoformat(),
+                    "first_seen": now_iso,
                     "count": 0,
                     "reasons": [],
                 }
+            else:
+                self._failed_queries.move_to_end(query_lower)
 
-            entry = self._failed_queries[query_lower]
             entry["count"] += 1
-            entry["last_seen"] = datetime.utcnow().isoformat()
+            entry["last_seen"] = now_iso
 
             # Track unique reasons
             reason_entry = {
                 "reason": reason,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso,
             }
             if intent_detected:
                 reason_entry["intent"] = intent_detected
@@ -128,10 +396,16 @@ class SearchAnalytics:
             if error_message:
                 reason_entry["error"] = error_message
 
-            # Keep last 5 failure reasons per query
-            entry["reasons"] = entry.get("reasons", [])[-4:] + [reason_entry]
+            # Keep last 5 failure reasons per query (trimmed in place)
+            reasons = entry.setdefault("reasons", [])
+            reasons.append(reason_entry)
+            self._count_reasons([reason_entry], 1)
+            if len(reasons) > 5:
+                self._count_reasons(reasons[:-5], -1)
+                del reasons[:-5]
 
-            self._save_failed_queries()
+            self._record_event("failed", query_lower, entry)
+            self._evict_overflow("failed", self._failed_queries)
 
     def record_low_confidence_match(
         self,
@@ -153,40 +427,62 @@ class SearchAnalytics:
             confidence: The match confidence score
             match_method: How it was matched (fuzzy, token, etc.)
         """
-        query_lower = query.lower().strip()
+        query_lower = _query_key(query)
+        now_iso = _now_iso()
 
-        with self._lock:
-            if query_lower not in self._low_confidence:
-                self._low_confidence[query_lower] = {
+        with self._lowconf_lock:
+            entry = self._low_confidence.get(query_lower)
+            if entry is None:
+                entry = self._low_confidence[query_lower] = {
                     "query": query,
-                    "first_seen": datetime.utcnow().isoformat(),
+                    "first_seen": now_iso,
                     "count": 0,
                     "matches": [],
                 }
+            else:
+                self._low_confidence.move_to_end(query_lower)
 
-            entry = self._low_confidence[query_lower]
             entry["count"] += 1
-            entry["last_seen"] = datetime.utcnow().isoformat()
+            entry["last_seen"] = now_iso
 
             match_entry = {
                 "entity": matched_entity,
                 "type": entity_type,
                 "confidence": round(confidence, 3),
                 "method": match_method,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now_iso,
             }
 
-            # Keep last 3 matches per query
-            entry["matches"] = entry.get("matches", [])[-2:] + [match_entry]
+            # Keep last 3 matches per query (trimmed in place)
+            matches = entry.setdefault("matches", [])
+            matches.append(match_entry)
+            if len(matches) > 3:
+                del matches[:-3]
 
-            self._save_low_confidence()
+            self._record_event("low_confidence", query_lower, entry)
+            self._evict_overflow("low_confidence", self._low_confidence)
 
     def record_successful_query(self, query: str, result_type: str):
         """Record a successful query for popularity tracking."""
-        query_lower = query.lower().strip()
-        with self._lock:
+        query_lower = _query_key(query)
+        with self._counts_lock:
             self._query_counts[query_lower] += 1
 
+    @staticmethod
+    def _entry_copy(entry: Dict, list_field: str) -> Dict:
+        """Copy of a stored entry for callers (records append to its list field in place, so that is copied too)."""
+        copy = dict(entry)
+        if list_field in entry:
+            copy[list_field] = list(entry[list_field])
+        return copy
+
+    @classmethod
+    def _entry_snapshot(cls, key: str, entry: Dict, list_field: str) -> Dict:
+        """Copy of a stored entry tagged with its query key."""
+        snapshot = cls._entry_copy(entry, list_field)
+        snapshot["query_key"] = key
+        return snapshot
+
     def get_failed_queries(self, min_count: int = 1, limit: int = 100) -> List[Dict]:
         """
         Get failed queries sorted by count.
@@ -198,15 +494,17 @@ class SearchAnalytics:
         Returns:
             List of failed query entries
         """
-        with self._lock:
-            queries = [
-                {**v, "query_key": k}
-                for k, v in self._failed_queries.items()
-                if v.get("count", 0) >= min_count
-            ]
-
-        queries.sort(key=lambda x: x.get("count", 0), reverse=True)
-        return queries[:limit]
+        with self._failed_lock:
+            # Top-k selection first, so only the returned entries are copied
+            top = nlargest(
+                limit,
+                (
+                    (k, v) for k, v in self._failed_queries.items()
+                    if v.get("count", 0) >= min_count
+                ),
+                key=lambda kv: kv[1].get("count", 0),
+            )
+            return [self._entry_snapshot(k, v, "reasons") for k, v in top]
 
     def get_low_confidence_queries(self, max_confidence: float = 0.85, limit: int = 100) -> List[Dict]:
         """
@@ -219,23 +517,23 @@ class SearchAnalytics:
         Returns:
             List of low confidence query entries
         """
-        with self._lock:
-            queries = []
-            for k, v in self._low_confidence.items():
-                matches = v.get("matches", [])
-                if matches:
-                    # Get the most recent match confidence
-                    latest_confidence = matches[-1].get("confidence", 1.0)
-                    if latest_confidence <= max_confidence:
-                        queries.append({**v, "query_key": k})
-
-        queries.sort(key=lambda x: x.get("count", 0), reverse=True)
-        return queries[:limit]
+        with self._lowconf_lock:
+            # Filter on the most recent match confidence
+            top = nlargest(
+                limit,
+                (
+                    (k, v) for k, v in self._low_confidence.items()
+                    if v.get("matches")
+                    and v["matches"][-1].get("confidence", 1.0) <= max_confidence
+                ),
+                key=lambda kv: kv[1].get("count", 0),
+            )
+            return [self._entry_snapshot(k, v, "matches") for k, v in top]
 
     def get_summary(self) -> Dict[str, Any]:
         """Get analytics summary."""
-        # Get counts under lock
-        with self._lock:
+        # Get counts under the locks (fixed order: failed, low confidence)
+        with self._failed_lock, self._lowconf_lock:
             failed_count = len(self._failed_queries)
             low_conf_count = len(self._low_confidence)
 
@@ -251,13 +549,18 @@ class SearchAnalytics:
         """
         Export all analytics data for manual review.
 
-        Returns dict suitable for analysis/improvement.
+        Returns dict suitable for analysis/improvement (copies taken under
+        the store locks, safe to serialize while queries keep being recorded).
         """
-        with self._lock:
+        with self._failed_lock, self._lowconf_lock:
             return {
                 "exported_at": datetime.utcnow().isoformat(),
-                "failed_queries": self._failed_queries,
-                "low_confidence_queries": self._low_confidence,
+                "failed_queries": {
+                    k: self._entry_copy(v, "reasons") for k, v in self._failed_queries.items()
+                },
+                "low_confidence_queries": {
+                    k: self._entry_copy(v, "matches") for k, v in self._low_confidence.items()
+                },
                 "summary": {
                     "total_failed": len(self._failed_queries),
                     "total_low_confidence": len(self._low_confidence),
@@ -266,12 +569,16 @@ class SearchAnalytics:
             }
 
     def _get_failure_reasons(self) -> Dict[str, int]:
-        """Get count of each failure reason."""
-        reasons = defaultdict(int)
-        for entry in self._failed_queries.values():
-            for r in entry.get("reasons", []):
-                reasons[r.get("reason", "unknown")] += 1
-        return dict(reasons)
+        """Get count of each failure reason (maintained as queries are recorded)."""
+        return dict(self._reason_counts)
+
+    @staticmethod
+    def _expired_keys(data: Dict[str, Dict], cutoff_str: str) -> List[str]:
+        """Keys of entries last seen before cutoff_str (ISO strings compare in time order)."""
+        return [
+            k for k, v in data.items()
+            if v.get("last_seen", v.get("first_seen", "")) < cutoff_str
+        ]
 
     def clear_old_entries(self, days: int = 30):
         """Clear entries older than specified days."""
@@ -279,20 +586,17 @@ class SearchAnalytics:
         cutoff = datetime.utcnow() - timedelta(days=days)
         cutoff_str = cutoff.isoformat()
 
-        with self._lock:
-            # Clear old failed queries
-            self._failed_queries = {
-                k: v for k, v in self._failed_queries.items()
-                if v.get("last_seen", v.get("first_seen", "")) >= cutoff_str
-            }
-            self._save_failed_queries()
+        with self._failed_lock, self._lowconf_lock:
+            # Clear old failed queries (in place, dropping their reasons)
+            for k in self._expired_keys(self._failed_queries, cutoff_str):
+                entry = self._failed_queries.pop(k)
+                self._count_reasons(entry.get("reasons", []), -1)
 
             # Clear old low confidence
-            self._low_confidence = {
-                k: v for k, v in self._low_confidence.items()
-                if v.get("last_seen", v.get("first_seen", "")) >= cutoff_str
-            }
-            self._save_low_confidence()
+            for k in self._expired_keys(self._low_confidence, cutoff_str):
+                del self._low_confidence[k]
+
+        self.flush(compact=True)
 
 
 # Global instance
@@ -323,25 +627,30 @@ def record_search_result(
     """
     Convenience function to record a search result.
 
-    Call this after each search to build analytics.
+    Call this after each search to build analytics. Recording happens on
+    a background thread, so this returns without waiting on locks or I/O.
     """
     analytics = get_analytics()
 
     if not success:
-        analytics.record_failed_query(
-            query=query,
-            reason=error_reason or "unknown",
-            intent_detected=intent_detected,
-            entities_found=entities_found,
-            error_message=error_message,
-        )
+        analytics.record_async(analytics.record_failed_query, {
+            "query": query,
+            "reason": error_reason or "unknown",
+            "intent_detected": intent_detected,
+            "entities_found": entities_found,
+            "error_message": error_message,
+        })
     elif confidence is not None and confidence < 0.85 and matched_entity:
-        analytics.record_low_confidence_match(
-            query=query,
-            matched_entity=matched_entity,
-            entity_type=entity_type or "unknown",
-            confidence=confidence,
-            match_method=match_method or "unknown",
-        )
+        analytics.record_async(analytics.record_low_confidence_match, {
+            "query": query,
+            "matched_entity": matched_entity,
+            "entity_type": entity_type or "unknown",
+            "confidence": confidence,
+            "match_method": match_method or "unknown",
+        })
     else:
-        analytics.record_successful_query(query, result_type or "unknown")
+        analytics.record_async(
+            analytics.record_successful_query,
+            {"query": query, "result_type": result_type or "unknown"},
+            low_priority=True,
+        )
@@ -23,16 +23,27 @@ import os
 import re
 import sys
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Set
 
 from config.settings import settings
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+# Parallel standings / roster fetches (api_client's global semaphore still
+# caps concurrent API requests)
+BOOTSTRAP_MAX_WORKERS = 8
+
 
 # =============================================================================
 # AUTO-ALIAS GENERATION (duplicated from entities.py to avoid circular imports)
@@ -152,6 +163,16 @@ def expand_api_name(api_name: str) -> Set[str]:
     return aliases
 
 
+def sorted_aliases(aliases: Set[str]) -> List[str]:
+    """
+    Sorted alias list with every alias interned.
+
+    The same aliases recur across teams, players and the seed file, so
+    interning lets them share one string object and compare by identity.
+    """
+    return sorted(map(sys.intern, aliases))
+
+
 def load_seed_file(seed_path: Path) -> Dict[str, Any]:
     """Load the curated seed file."""
     if not seed_path.exists():
@@ -164,6 +185,10 @@ def load_seed_file(seed_path: Path) -> Dict[str, Any]:
             "metrics": {},
         }
 
+    if HAS_ORJSON:
+        with open(seed_path, "rb") as f:
+            return orjson.loads(f.read())
+
     with open(seed_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -178,10 +203,16 @@ def fetch_teams_from_standings(league_ids: List[int], season: int) -> Dict[str,
 
     teams = {}
 
-    for league_id in league_ids:
-        print(f"  Fetching standings for league {league_id}...")
+    with ThreadPoolExecutor(max_workers=BOOTSTRAP_MAX_WORKERS) as executor:
+        futures = []
+        for league_id in league_ids:
+            print(f"  Fetching standings for league {league_id}...")
+            futures.append(executor.submit(get_standings, season, league_id))
+
+    # Results in league order, so a team in several leagues keeps the first
+    for league_id, future in zip(league_ids, futures):
         try:
-            data = get_standings(season, league_id)
+            data = future.result()
             standings = data.get("standings", [])
 
             for team_row in standings:
@@ -197,7 +228,7 @@ def fetch_teams_from_standings(league_ids: List[int], season: int) -> Dict[str,
 
                         teams[team_id] = {
                             "canonical": team_name,
-                            "aliases": sorted(list(auto_aliases)),
+                            "aliases": sorted_aliases(auto_aliases),
                             "league_id": league_id,
                         }
                     else:
@@ -228,11 +259,21 @@ def fetch_players_for_teams(team_ids: List[str], season: int, limit: int = 50) -
 
     players = {}
     processed = 0
+    team_ids = team_ids[:limit]
+
+    def fetch_team(team_id: str) -> Dict[str, Any]:
+        return get_team_players(int(team_id), season)
+
+    with ThreadPoolExecutor(max_workers=BOOTSTRAP_MAX_WORKERS) as executor:
+        futures = []
+        for team_id in team_ids:
+            print(f"  Fetching players for team {team_id}...")
+            futures.append(executor.submit(fetch_team, team_id))
 
-    for team_id in team_ids[:limit]:
-        print(f"  Fetching players for team {team_id}...")
+    # Results in team order, so a player listed by several teams keeps the last
+    for team_id, future in zip(team_ids, futures):
         try:
-            data = get_team_players(int(team_id), season)
+            data = future.result()
             player_list = data.get("players", [])
 
             for player in player_list:
@@ -248,7 +289,7 @@ def fetch_players_for_teams(team_ids: List[str], season: int, limit: int = 50) -
 
                     players[player_id] = {
                         "canonical": player_name,
-                        "aliases": sorted(list(auto_aliases)),  # Sort for readability
+                        "aliases": sorted_aliases(auto_aliases),  # Sort for readability
                         "team_id": int(team_id),
                     }
 
@@ -292,7 +333,7 @@ def fetch_top_players(league_ids: List[int], season: int) -> Dict[str, Dict[str,
 
                     players[player_id] = {
                         "canonical": player_name,
-                        "aliases": sorted(list(auto_aliases)),
+                        "aliases": sorted_aliases(auto_aliases),
                         "team_id": team_id,
                     }
 
@@ -317,7 +358,7 @@ def fetch_top_players(league_ids: List[int], season: int) -> Dict[str, Dict[str,
 
                     players[player_id] = {
                         "canonical": player_name,
-                        "aliases": sorted(list(auto_aliases)),
+                        "aliases": sorted_aliases(auto_aliases),
                         "team_id": team_id,
                     }
 
@@ -329,6 +370,21 @@ def fetch_top_players(league_ids: List[int], season: int) -> Dict[str, Dict[str,
     return players
 
 
+def _overlay_seed(entries: Dict[str, Dict[str, Any]], seed_entries: Dict[str, Dict[str, Any]]):
+    """Overlay curated seed entries onto API entries in place (aliases are unioned)."""
+    for entry_id, seed_entry in seed_entries.items():
+        existing = entries.get(entry_id)
+        if existing is None:
+            entries[entry_id] = seed_entry
+            continue
+
+        # Merge aliases, keeping seed aliases
+        aliases = set(existing.get("aliases", ()))
+        aliases.update(map(sys.intern, seed_entry.get("aliases", ())))
+        existing["aliases"] = list(aliases)
+        existing["canonical"] = seed_entry.get("canonical", existing["canonical"])
+
+
 def merge_aliases(
     seed_data: Dict[str, Any],
     api_teams: Dict[str, Dict[str, Any]],
@@ -339,44 +395,22 @@ def merge_aliases(
 
     Seed data takes precedence for aliases (curated nicknames).
     API data fills in missing teams/players.
+
+    Entry dicts from the inputs are reused (and updated) rather than copied,
+    so the inputs should not be used afterwards.
     """
     result = {
         "version": seed_data.get("version", "1.0.0"),
         "generated_at": datetime.utcnow().isoformat() + "Z",
-        "teams": {},
-        "players": {},
+        "teams": dict(api_teams),
+        "players": dict(api_players),
         "competitions": seed_data.get("competitions", {}),
         "metrics": seed_data.get("metrics", {}),
     }
 
-    # Merge teams: API data first, then overlay seed data
-    for team_id, team_data in api_teams.items():
-        result["teams"][team_id] = team_data.copy()
-
-    for team_id, team_data in seed_data.get("teams", {}).items():
-        if team_id in result["teams"]:
-            # Merge aliases, keeping seed aliases
-            existing = result["teams"][team_id]
-            existing_aliases = set(existing.get("aliases", []))
-            seed_aliases = set(team_data.get("aliases", []))
-            existing["aliases"] = list(seed_aliases | existing_aliases)
-            existing["canonical"] = team_data.get("canonical", existing["canonical"])
-        else:
-            result["teams"][team_id] = team_data.copy()
-
-    # Merge players: API data first, then overlay seed data
-    for player_id, player_data in api_players.items():
-        result["players"][player_id] = player_data.copy()
-
-    for player_id, player_data in seed_data.get("players", {}).items():
-        if player_id in result["players"]:
-            existing = result["players"][player_id]
-            existing_aliases = set(existing.get("aliases", []))
-            seed_aliases = set(player_data.get("aliases", []))
-            existing["aliases"] = list(seed_aliases | existing_aliases)
-            existing["canonical"] = player_data.get("canonical", existing["canonical"])
-        else:
-            result["players"][player_id] = player_data.copy()
+    # API data first, then overlay seed data
+    _overlay_seed(result["teams"], seed_data.get("teams", {}))
+    _overlay_seed(result["players"], seed_data.get("players", {}))
 
     return result
 
@@ -466,8 +500,15 @@ def main():
     # Write output
     print(f"6. Writing to {output_path}...")
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if HAS_ORJSON:
+        # orjson OPT_INDENT_2: 2-space indent, raw UTF-8, no trailing newline.
+        # Matches the json.dump() fallback for the checked-in alias files, but
+        # orjson rejects non-str keys and formats floats differently.
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
     print("   Done!")
     print()
 
@@ -4,8 +4,10 @@ import json
 import os
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 
 try:
     from Levenshtein import ratio as levenshtein_ratio
@@ -13,6 +15,12 @@ try:
 except ImportError:
     HAS_LEVENSHTEIN = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .models.entities import (
     EntityMatch,
     TeamEntity,
@@ -57,6 +65,12 @@ SKIP_TOKENS = {
     "top", "scorers", "assists",  # Stats words (added for clarity)
 }
 
+# Unified alias database generated by bootstrap_aliases
+DEFAULT_ALIASES_PATH = Path(__file__).parent.parent.parent.parent / "data" / "aliases.json"
+
+# Shared immutable default for missing alias sections / entries
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 # Multi-word phrases where skip tokens are part of the entity name
 # These should be preserved during tokenization
 PRESERVE_ENTITY_PHRASES = {
@@ -460,12 +474,15 @@ def multi_token_match_score(tokens: List[str], target: str, aliases: List[str] =
     return best_overall
 
 
-def fuzzy_match(query: str, target: str) -> float:
+def fuzzy_match(query: str, target: str, min_ratio: float = 0.0) -> float:
     """
     Calculate fuzzy match ratio between two strings.
 
     Uses Levenshtein distance if available, otherwise SequenceMatcher.
     Also checks for last-name-only matches with priority for players.
+
+    With min_ratio, pairs whose ratio provably stays below it (see
+    _below_ratio) return 0.0 without running the edit-distance scoring.
     """
     query_lower = query.lower().strip()
     target_lower = target.lower().strip()
@@ -498,6 +515,9 @@ def fuzzy_match(query: str, target: str) -> float:
         containment_ratio = len(query_lower) / len(target_lower)
         return max(0.80, containment_ratio)
 
+    if min_ratio and _below_ratio(query_lower, target_lower, min_ratio):
+        return 0.0
+
     # Use Levenshtein if available, combined with SequenceMatcher
     seq_ratio = SequenceMatcher(None, query_lower, target_lower).ratio()
 
@@ -509,6 +529,110 @@ def fuzzy_match(query: str, target: str) -> float:
     return seq_ratio
 
 
+def _below_ratio(a: str, b: str, min_ratio: float) -> bool:
+    """
+    True if neither the SequenceMatcher nor the Levenshtein ratio of a, b can
+    reach min_ratio.
+
+    Each ratio is at most 2 * (characters the strings share, counted with
+    multiplicity) / (combined length), and the shared count is at most the
+    shorter length - checked first since it is free.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    limit = min_ratio * (len(a) + len(b))
+    if 2 * len(a) < limit:
+        return True
+    chars = set(a)
+    shared = sum(map(min, map(a.count, chars), map(b.count, chars)))
+    return 2 * shared < limit
+
+
+@lru_cache(maxsize=4096)
+def _trigrams(text: str) -> frozenset:
+    """Padded character trigrams: "ab" -> {"  a", " ab", "ab "}."""
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def word_boundary_match(query: str, target: str) -> bool:
+    """
+    True if every query word is a prefix of a target word, in order.
+
+    Rewards matches on word boundaries rather than mid-word:
+    "k mbappe" -> "kylian mbappe", "m salah" -> "mohamed salah".
+    """
+    target_words = iter(target.split())
+    return all(
+        any(word.startswith(part) for word in target_words)
+        for part in query.split()
+    )
+
+
+def partial_fuzzy_match(query: str, target: str, min_ratio: float = 0.0) -> float:
+    """
+    Best fuzzy ratio of query against the full target or any single word in it.
+
+    Catches typos in one part of a multi-word name, e.g. "mbape" against
+    "Kylian Mbappe" scores like "mbape" against "mbappe". With min_ratio the
+    result is exact when it reaches min_ratio and may be 0.0 otherwise.
+    """
+    best = fuzzy_match(query, target, min_ratio)
+    for word in target.split():
+        if best >= 1.0:
+            break
+        best = max(best, fuzzy_match(query, word, min_ratio))
+    return best
+
+
+def player_match_score(player: Dict[str, Any], normalized_query: str) -> float:
+    """
+    Score how well a player matches an already-normalized query.
+
+    Higher score = better match. Shared by the legacy search helpers in
+    app.search_utils and app.api_client.
+    """
+    player_name = normalize_for_matching(player.get("name", "") or "")
+
+    score = 0.0
+
+    # Exact match
+    if player_name == normalized_query:
+        score += 100
+
+    # Name starts with query
+    elif player_name.startswith(normalized_query):
+        score += 50
+
+    # Query words start name words, in order ("k mbappe", "salah")
+    elif normalized_query and word_boundary_match(normalized_query, player_name):
+        score += 40
+
+    # Query is in name
+    elif normalized_query in player_name:
+        score += 25
+
+    # Graded typo tolerance ("mbape" -> "mbappe"), never above a substring hit.
+    # The threshold lets names that cannot reach it skip the fuzzy scoring.
+    elif normalized_query and player_name:
+        threshold = get_fuzzy_threshold(normalized_query)
+        ratio = partial_fuzzy_match(normalized_query, player_name, threshold)
+        if ratio >= threshold:
+            score += 25 * ratio
+
+    return score + _notability_bonus(
+        player.get("appearances", 0) or 0,
+        player.get("goals", 0) or 0,
+        player.get("assists", 0) or 0,
+    )
+
+
+def _notability_bonus(appearances: int, goals: int, assists: int) -> float:
+    """Bonus for more notable players (appearances, goals and assists)."""
+    # Cap at 20 bonus points for appearances, 15 for goal contributions
+    return min(appearances * 0.5, 20) + min((goals + assists) * 0.3, 15)
+
+
 def get_fuzzy_threshold(query: str) -> float:
     """
     Get fuzzy matching threshold based on query length.
@@ -526,35 +650,60 @@ def get_fuzzy_threshold(query: str) -> float:
         return 0.70  # Long queries - be stricter
 
 
+@lru_cache(maxsize=8)
+def _load_alias_file(path: str) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Parse an aliases JSON file into read-only sections.
+
+    Cached per resolved path so every AliasDatabase over the same file shares
+    one parsed object. reload_aliases() clears the cache to pick up edits.
+    """
+    if HAS_ORJSON:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    return MappingProxyType({
+        section: MappingProxyType(data.get(section, {}))
+        for section in ("teams", "players", "competitions", "metrics")
+    })
+
+
 class AliasDatabase:
     """Database of entity aliases for matching."""
 
     def __init__(self, aliases_path: Optional[str] = None):
-        self.teams: Dict[str, Dict[str, Any]] = {}
-        self.players: Dict[str, Dict[str, Any]] = {}
-        self.competitions: Dict[str, Dict[str, Any]] = {}
-        self.metrics: Dict[str, List[str]] = {}
+        # Read-only views: the database is shared process-wide, and the exact
+        # alias index is only valid while the underlying mappings are unchanged
+        self.teams: Mapping[str, Dict[str, Any]] = _EMPTY_MAPPING
+        self.players: Mapping[str, Dict[str, Any]] = _EMPTY_MAPPING
+        self.competitions: Mapping[str, Dict[str, Any]] = _EMPTY_MAPPING
+        self.metrics: Mapping[str, List[str]] = _EMPTY_MAPPING
+        # entity_type -> (source mapping, {alias: (position, entity_id)})
+        self._exact_indexes: Dict[str, Tuple[Mapping[str, Dict[str, Any]], Dict[str, Tuple[int, str]]]] = {}
+        # entity_type -> (source mapping, {trigram: {entity_id, ...}})
+        self._trigram_indexes: Dict[str, Tuple[Mapping[str, Dict[str, Any]], Dict[str, set]]] = {}
 
         if aliases_path:
             self.load(aliases_path)
         else:
             # Try default path
-            default_path = Path(__file__).parent.parent.parent.parent / "data" / "aliases.json"
-            if default_path.exists():
-                self.load(str(default_path))
+            if DEFAULT_ALIASES_PATH.exists():
+                self.load(str(DEFAULT_ALIASES_PATH))
 
     def load(self, path: str) -> None:
-        """Load aliases from JSON file."""
+        """Load aliases from JSON file (parsed once per path, see _load_alias_file)."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            self.teams = data.get("teams", {})
-            self.players = data.get("players", {})
-            self.competitions = data.get("competitions", {})
-            self.metrics = data.get("metrics", {})
+            data = _load_alias_file(str(Path(path).resolve()))
         except (FileNotFoundError, json.JSONDecodeError):
-            pass  # Use empty databases
+            return  # Use empty databases
+
+        self.teams = data["teams"]
+        self.players = data["players"]
+        self.competitions = data["competitions"]
+        self.metrics = data["metrics"]
 
     def match_team(self, query: str) -> List[EntityMatch]:
         """Match query against team aliases."""
@@ -586,10 +735,73 @@ class AliasDatabase:
 
         return None
 
+    def _get_exact_index(
+        self,
+        entities: Mapping[str, Dict[str, Any]],
+        entity_type: str,
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        Flat alias -> (position, entity_id) index over manual + auto aliases.
+
+        Built once per entity database so exact lookups are a dict hit instead
+        of regenerating every entity's aliases on every query. Position keeps
+        the first entity (in database order) on alias collisions.
+        """
+        cached = self._exact_indexes.get(entity_type)
+        if cached is not None and cached[0] is entities:
+            return cached[1]
+
+        index: Dict[str, Tuple[int, str]] = {}
+        for position, (entity_id, entity_data) in enumerate(entities.items()):
+            canonical = entity_data["canonical"]
+            manual_aliases = [a.lower() for a in entity_data.get("aliases", [])]
+
+            # Generate auto-aliases based on entity type
+            if entity_type == "player":
+                auto_aliases = generate_person_aliases(canonical)
+                # Also expand API-format name if canonical looks like "N. Name"
+                auto_aliases.update(expand_api_name(canonical))
+            elif entity_type == "team":
+                auto_aliases = generate_team_aliases(canonical)
+            else:
+                auto_aliases = set()
+
+            for alias in set(manual_aliases) | auto_aliases:
+                index.setdefault(alias, (position, entity_id))
+
+        self._exact_indexes[entity_type] = (entities, index)
+        return index
+
+    def _get_trigram_candidates(
+        self,
+        entities: Mapping[str, Dict[str, Any]],
+        entity_type: str,
+        query: str,
+    ) -> set:
+        """
+        Entity IDs whose canonical name or a manual alias shares at least one
+        padded trigram with the query (trigram -> entity IDs inverted index).
+        """
+        cached = self._trigram_indexes.get(entity_type)
+        if cached is None or cached[0] is not entities:
+            index: Dict[str, set] = {}
+            for entity_id, entity_data in entities.items():
+                for text in [entity_data["canonical"], *entity_data.get("aliases", [])]:
+                    for trigram in _trigrams(text.lower().strip()):
+                        index.setdefault(trigram, set()).add(entity_id)
+            cached = (entities, index)
+            self._trigram_indexes[entity_type] = cached
+
+        index = cached[1]
+        candidates: set = set()
+        for trigram in _trigrams(query.lower().strip()):
+            candidates.update(index.get(trigram, ()))
+        return candidates
+
     def _match_entities(
         self,
         query: str,
-        entities: Dict[str, Dict[str, Any]],
+        entities: Mapping[str, Dict[str, Any]],
         entity_type: str = "unknown",
     ) -> List[EntityMatch]:
         """
@@ -619,35 +831,24 @@ class AliasDatabase:
         tokens_combined = " ".join(tokens) if tokens else ""
 
         # Phase 1: Exact alias lookup (fast path)
-        for entity_id, entity_data in entities.items():
-            canonical = entity_data["canonical"]
-            manual_aliases = [a.lower() for a in entity_data.get("aliases", [])]
-
-            # Generate auto-aliases based on entity type
-            if entity_type == "player":
-                auto_aliases = generate_person_aliases(canonical)
-                # Also expand API-format name if canonical looks like "N. Name"
-                auto_aliases.update(expand_api_name(canonical))
-            elif entity_type == "team":
-                auto_aliases = generate_team_aliases(canonical)
-            else:
-                auto_aliases = set()
-
-            # Combine manual + auto aliases
-            all_aliases = set(manual_aliases) | auto_aliases
-
-            # Check exact match against any alias (including tokens-only version)
-            # This allows "la liga standings" to match "la liga" alias
-            if (query_normalized in all_aliases or
-                query_unicode_normalized in all_aliases or
-                (tokens_combined and tokens_combined in all_aliases)):
-                return [EntityMatch(
-                    entity_id=entity_id,
-                    name=canonical,
-                    confidence=1.0,
-                    match_method="alias_exact",
-                    matched_text=query,
-                )]
+        # Check exact match against any alias (including tokens-only version)
+        # This allows "la liga standings" to match "la liga" alias
+        exact_index = self._get_exact_index(entities, entity_type)
+        hits = [
+            exact_index[key]
+            for key in (query_normalized, query_unicode_normalized, tokens_combined)
+            if key and key in exact_index
+        ]
+        if hits:
+            # Earliest entity wins, same as scanning the database in order
+            _, entity_id = min(hits)
+            return [EntityMatch(
+                entity_id=entity_id,
+                name=entities[entity_id]["canonical"],
+                confidence=1.0,
+                match_method="alias_exact",
+                matched_text=query,
+            )]
 
         # Phase 2: Token-based matching with auto-generated aliases (forgiving)
         tokens = get_entity_tokens(query)
@@ -702,34 +903,44 @@ class AliasDatabase:
                         break  # Only one match per entity
 
         # Phase 4: Legacy fuzzy matching (if nothing found yet)
+        # Entities sharing a trigram with the query are scored first. A typo
+        # can break every shared trigram and still clear the threshold, so
+        # when none of them match the remaining entities are scanned too:
+        # only queries without any fuzzy match pay for the full scan.
         if not matches:
-            for entity_id, entity_data in entities.items():
-                canonical = entity_data["canonical"]
-
-                # Check canonical name (includes last-name matching)
-                ratio = fuzzy_match(query_normalized, canonical)
-                if ratio >= threshold:
-                    matches.append(EntityMatch(
-                        entity_id=entity_id,
-                        name=canonical,
-                        confidence=ratio,
-                        match_method="fuzzy_canonical",
-                        matched_text=query,
-                    ))
-
-                # Check manual aliases with slightly higher threshold
-                alias_threshold = min(threshold + 0.05, 0.75)
-                for alias in entity_data.get("aliases", []):
-                    ratio = fuzzy_match(query_normalized, alias)
-                    if ratio >= alias_threshold:
+            candidates = self._get_trigram_candidates(entities, entity_type, query_normalized)
+            for rescan in (False, True):
+                for entity_id, entity_data in entities.items():
+                    if (entity_id in candidates) == rescan:
+                        continue
+                    canonical = entity_data["canonical"]
+
+                    # Check canonical name (includes last-name matching)
+                    ratio = fuzzy_match(query_normalized, canonical)
+                    if ratio >= threshold:
                         matches.append(EntityMatch(
                             entity_id=entity_id,
                             name=canonical,
-                            confidence=ratio * 0.95,  # Slight penalty for alias match
-                            match_method="fuzzy_alias",
+                            confidence=ratio,
+                            match_method="fuzzy_canonical",
                             matched_text=query,
                         ))
 
+                    # Check manual aliases with slightly higher threshold
+                    alias_threshold = min(threshold + 0.05, 0.75)
+                    for alias in entity_data.get("aliases", []):
+                        ratio = fuzzy_match(query_normalized, alias)
+                        if ratio >= alias_threshold:
+                            matches.append(EntityMatch(
+                                entity_id=entity_id,
+                                name=canonical,
+                                confidence=ratio * 0.95,  # Slight penalty for alias match
+                                match_method="fuzzy_alias",
+                                matched_text=query,
+                            ))
+                if matches:
+                    break
+
         # Deduplicate and sort by confidence
         seen = set()
         unique_matches = []
@@ -808,7 +1019,7 @@ def extract_entities(
         ExtractionResult with all extracted entities
     """
     if alias_db is None:
-        alias_db = AliasDatabase()
+        alias_db = get_alias_database()
 
     # Extract pronouns first
     pronouns = extract_pronouns(query)
@@ -836,12 +1047,12 @@ def extract_entities(
 
     # Convert to entity objects
     teams = [
-        TeamEntity.from_match(m, alias_db.teams.get(m.entity_id, {}).get("league_id"))
+        TeamEntity.from_match(m, alias_db.teams.get(m.entity_id, _EMPTY_MAPPING).get("league_id"))
         for m in _dedupe_matches(team_matches)
     ]
 
     players = [
-        PlayerEntity.from_match(m, alias_db.players.get(m.entity_id, {}).get("team_id"))
+        PlayerEntity.from_match(m, alias_db.players.get(m.entity_id, _EMPTY_MAPPING).get("team_id"))
         for m in _dedupe_matches(player_matches)
     ]
 
@@ -885,4 +1096,5 @@ def get_alias_database() -> AliasDatabase:
 def reload_aliases(path: Optional[str] = None) -> None:
     """Reload the alias database from disk."""
     global _alias_db
+    _load_alias_file.cache_clear()
     _alias_db = AliasDatabase(path)
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import date, timedelta
+from heapq import nlargest
 
 from .models.intent import IntentType, IntentResult
 from .resolver import ResolvedQuery
@@ -330,9 +331,9 @@ class QueryExecutor:
 
         try:
             squad_data = squad_future.result()
-            # Sort players by goals to get actual top scorers
+            # Top 5 players by goals (partial sort, same order as sorted()[:5])
             players = squad_data.get("players", [])
-            top_scorers = sorted(players, key=lambda p: p.get("goals", 0), reverse=True)[:5]
+            top_scorers = nlargest(5, players, key=lambda p: p.get("goals", 0))
             sources.append("api_football:players")
         except Exception:
             top_scorers = []
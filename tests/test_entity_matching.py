@@ -0,0 +1,77 @@
+"""
+Unit tests for fuzzy entity matching.
+
+Pins the results of typo queries so the trigram candidate prefilter in the
+fuzzy phase cannot silently drop matches a full scan would find.
+"""
+import json
+
+import pytest
+
+from app.utils.search.entities import AliasDatabase
+
+
+ALIASES = {
+    "teams": {
+        "42": {"canonical": "Arsenal", "aliases": ["arsenal", "gunners", "the gunners", "afc"]},
+        "33": {"canonical": "Manchester United", "aliases": ["manchester united", "man utd", "mufc"]},
+        "40": {"canonical": "Liverpool", "aliases": ["liverpool", "lfc", "pool"]},
+        "49": {"canonical": "Chelsea", "aliases": ["chelsea", "cfc", "the blues"]},
+        "489": {"canonical": "AC Milan", "aliases": ["ac milan", "milan", "rossoneri", "acm"]},
+        "496": {"canonical": "Juventus", "aliases": ["juventus", "juve", "bianconeri"]},
+    },
+    "players": {
+        "19465": {"canonical": "David Raya", "aliases": ["d raya", "david raya", "raya"]},
+        "47315": {"canonical": "Martín Zubimendi", "aliases": ["martin zubimendi", "zubimendi"]},
+        "2937": {"canonical": "D. Rice", "aliases": ["d rice", "rice"]},
+    },
+    "competitions": {},
+    "metrics": {},
+}
+
+# Typo queries that reach the fuzzy phase: (query, entity type, expected results)
+TYPO_QUERIES = [
+    ("arsenall fc", "team", [("42", "fuzzy_canonical", 0.778)]),
+    ("liverpol fc", "team", [("40", "fuzzy_canonical", 0.8)]),
+    ("c. wilan", "team", [("489", "fuzzy_canonical", 0.8)]),
+    # Shares no trigram with "AC Milan" or its aliases
+    ("c. wilon", "team", [("489", "fuzzy_canonical", 0.667)]),
+    ("c. rilon", "team", [("489", "fuzzy_canonical", 0.667)]),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "aliases.json"
+    path.write_text(json.dumps(ALIASES), encoding="utf-8")
+    return AliasDatabase(str(path))
+
+
+def _results(db, query, entity_type):
+    entities = {"team": db.teams, "player": db.players}[entity_type]
+    return [
+        (m.entity_id, m.match_method, round(m.confidence, 3))
+        for m in db._match_entities(query, entities, entity_type=entity_type)
+    ]
+
+
+@pytest.mark.parametrize("query,entity_type,expected", TYPO_QUERIES)
+def test_typo_query_results(db, query, entity_type, expected):
+    """Typo queries keep matching what they matched before the trigram prefilter."""
+    assert _results(db, query, entity_type) == expected
+
+
+@pytest.mark.parametrize("query,entity_type", [case[:2] for case in TYPO_QUERIES])
+def test_trigram_prefilter_matches_full_scan(db, monkeypatch, query, entity_type):
+    """Results with the trigram prefilter are the same as scoring every entity."""
+    with_prefilter = _results(db, query, entity_type)
+    monkeypatch.setattr(
+        AliasDatabase, "_get_trigram_candidates", lambda self, entities, entity_type, query: set(entities)
+    )
+    assert _results(db, query, entity_type) == with_prefilter
+
+
+def test_no_shared_trigram_still_matches(db):
+    """An entity sharing no trigram with the query is still found by the fallback scan."""
+    assert "489" not in db._get_trigram_candidates(db.teams, "team", "c wilon")
+    assert _results(db, "c. wilon", "team") == [("489", "fuzzy_canonical", 0.667)]
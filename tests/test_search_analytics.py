@@ -0,0 +1,73 @@
+"""
+Unit tests for search analytics persistence.
+
+Records are appended to the JSONL events log and periodically compacted
+into the JSON snapshots; reloading from either must give the same data.
+"""
+import pytest
+
+from app.utils.search.analytics import SearchAnalytics
+
+
+def _record_batch(analytics, rounds=3):
+    """Record repeated failed and low confidence queries."""
+    for i in range(rounds):
+        for j in range(5):
+            analytics.record_failed_query(
+                f"Query {j}", "no_data" if j % 2 else "no_entity_match", intent_detected="team"
+            )
+        for j in range(3):
+            analytics.record_low_confidence_match(f"Team {j}", f"Team {j} FC", "team", 0.5 + i / 10, "fuzzy")
+
+
+def _counts(analytics):
+    """Per-query counts and failure reasons, as exported for review."""
+    export = analytics.export_for_review()
+    return (
+        {k: v["count"] for k, v in export["failed_queries"].items()},
+        {k: v["count"] for k, v in export["low_confidence_queries"].items()},
+        export["summary"]["unique_failure_reasons"],
+    )
+
+
+@pytest.fixture
+def analytics(tmp_path):
+    return SearchAnalytics(str(tmp_path))
+
+
+def test_reload_replays_events_log(analytics, tmp_path):
+    """Records only in the events log are restored on reload."""
+    _record_batch(analytics)
+    analytics.flush()
+    assert analytics.events_file.stat().st_size > 0
+
+    expected = _counts(analytics)
+    assert expected[0] == {f"query {j}": 3 for j in range(5)}
+    assert expected[1] == {f"team {j}": 3 for j in range(3)}
+
+    assert _counts(SearchAnalytics(str(tmp_path))) == expected
+
+
+def test_compaction_keeps_counts(analytics, tmp_path):
+    """Compacting into the snapshots (and logging after it) loses nothing."""
+    _record_batch(analytics)
+    analytics.flush()
+    _record_batch(analytics, rounds=2)
+    analytics.flush(compact=True)
+    assert analytics.events_file.stat().st_size == 0
+
+    expected = _counts(analytics)
+    assert _counts(SearchAnalytics(str(tmp_path))) == expected
+
+    # New events on top of the compacted snapshots
+    _record_batch(analytics, rounds=1)
+    analytics.flush()
+    expected = _counts(analytics)
+    assert expected[0] == {f"query {j}": 6 for j in range(5)}
+
+    reloaded = SearchAnalytics(str(tmp_path))
+    assert _counts(reloaded) == expected
+
+    # And once more through a compaction of the reloaded instance
+    reloaded.flush(compact=True)
+    assert _counts(SearchAnalytics(str(tmp_path))) == expected
@@ -0,0 +1,108 @@
+"""
+Unit tests for the Sportmonks response cache.
+
+Covers request coalescing, TTL expiry and error handling in _make_request
+with the HTTP layer (_fetch) mocked out.
+"""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app import sportmonks_client
+
+
+ENDPOINT = "teams/1"  # Cached for an hour
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty response cache."""
+    sportmonks_client.clear_response_cache()
+    yield
+    sportmonks_client.clear_response_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the cache TTLs."""
+    now = [1000.0]
+    monkeypatch.setattr(sportmonks_client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_concurrent_misses_share_one_fetch(monkeypatch):
+    """Callers missing on the same key while it is being fetched wait for that fetch."""
+    waiters = 4
+    calls = []
+    release = threading.Event()
+
+    def fake_fetch(endpoint, params, include):
+        calls.append(endpoint)
+        release.wait(timeout=5)
+        return {"data": {"id": 1}}
+
+    monkeypatch.setattr(sportmonks_client, "_fetch", fake_fetch)
+    coalesced_before = sportmonks_client.get_response_cache_stats()["coalesced"]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(sportmonks_client._make_request(ENDPOINT)))
+        for _ in range(waiters + 1)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Hold the leader's fetch until every other caller has joined it
+    for _ in range(500):
+        if sportmonks_client.get_response_cache_stats()["coalesced"] - coalesced_before == waiters:
+            break
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [ENDPOINT]
+    assert len(results) == waiters + 1
+    assert all(result is results[0] for result in results)
+
+
+def test_cached_response_refetched_after_expiry(monkeypatch, clock):
+    """A cached response is served until its TTL passes, then fetched again."""
+    calls = []
+
+    def fake_fetch(endpoint, params, include):
+        calls.append(endpoint)
+        return {"data": {"id": len(calls)}}
+
+    monkeypatch.setattr(sportmonks_client, "_fetch", fake_fetch)
+    ttl = sportmonks_client._response_cache_ttl(ENDPOINT, {})
+
+    first = sportmonks_client._make_request(ENDPOINT)
+    clock[0] += ttl - 1
+    assert sportmonks_client._make_request(ENDPOINT) is first
+    assert len(calls) == 1
+
+    clock[0] += 1
+    refetched = sportmonks_client._make_request(ENDPOINT)
+    assert len(calls) == 2
+    assert refetched["data"]["id"] == 2
+
+
+def test_error_responses_not_cached(monkeypatch):
+    """Error responses are returned but never cached."""
+    responses = [{"data": None, "error": "500 Server Error"}, {"data": {"id": 1}}]
+    calls = []
+
+    def fake_fetch(endpoint, params, include):
+        calls.append(endpoint)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(sportmonks_client, "_fetch", fake_fetch)
+
+    assert "error" in sportmonks_client._make_request(ENDPOINT)
+    assert sportmonks_client.get_response_cache_stats()["entries"] == 0
+
+    assert sportmonks_client._make_request(ENDPOINT) == {"data": {"id": 1}}
+    assert sportmonks_client._make_request(ENDPOINT) == {"data": {"id": 1}}
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+"""
+Unit tests for the shared team fixtures windows.
+
+Pins the fixtures/between ranges the team helpers request: Sportmonks caps
+a per-team range at 100 days, so past and upcoming are separate windows.
+"""
+from datetime import date, datetime
+
+import pytest
+
+from app import sportmonks_client
+
+
+TEAM_ID = 42
+NOW = datetime(2026, 10, 17, 15, 30)
+PAST_ENDPOINT = f"fixtures/between/2026-07-19/2026-10-17/{TEAM_ID}"
+UPCOMING_ENDPOINT = f"fixtures/between/2026-10-17/2026-12-16/{TEAM_ID}"
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    """Endpoints requested through a mocked _make_request, with a fixed clock."""
+    endpoints = []
+
+    def fake_make_request(endpoint, params=None, include=None, **kwargs):
+        endpoints.append(endpoint)
+        return {"data": []}
+
+    monkeypatch.setattr(sportmonks_client, "_now_cached", lambda ttl=1.0: NOW)
+    monkeypatch.setattr(sportmonks_client, "_make_request", fake_make_request)
+    return endpoints
+
+
+def test_past_helpers_share_the_past_window(requested):
+    sportmonks_client.get_team_fixtures(TEAM_ID, upcoming=False)
+    sportmonks_client.get_team_recent_matches(TEAM_ID)
+    sportmonks_client.get_team_form(TEAM_ID)
+    assert requested == [PAST_ENDPOINT] * 3
+
+
+def test_upcoming_helpers_share_the_upcoming_window(requested):
+    sportmonks_client.get_team_fixtures(TEAM_ID, upcoming=True)
+    sportmonks_client.get_team_next_match(TEAM_ID)
+    assert requested == [UPCOMING_ENDPOINT] * 2
+
+
+@pytest.mark.parametrize("endpoint", [PAST_ENDPOINT, UPCOMING_ENDPOINT])
+def test_windows_within_range_cap(endpoint):
+    start, end = endpoint.split("/")[2:4]
+    assert (date.fromisoformat(end) - date.fromisoformat(start)).days <= 100